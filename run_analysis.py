@@ -22,14 +22,14 @@ Usage:
     python run_analysis.py --skip-preprocess           # skip steps 1-2 if data is already clean
 """
 
-import argparse
 import json
-import logging
 import os
 import re
-import subprocess
 import sys
-from datetime import datetime, timedelta
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Resolve paths relative to project root
@@ -45,6 +45,18 @@ MEMORY_DIR = PROJECT_ROOT / "memory"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
 SCHEMAS_DIR = PROJECT_ROOT / "config" / "schemas"
 
+# scripts/ holds the shared JSON helpers as well as the modules _import_script loads
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from json_io import dump_json, load_json, write_atomic, write_json_stdout
+
+
+def _print_lines(lines) -> None:
+    """Print each line with a single stdout write instead of one print() per line."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+
+
 # ─────────────────────────────────────────────
 # CHANNEL GROUPS & MAPPINGS
 # ─────────────────────────────────────────────
@@ -138,6 +150,9 @@ FILE_PREFIX_MAP = {
     "promo": "promo",
 }
 
+# Longest prefix first so e.g. "referral-program" is not claimed by "referral"
+_FILE_PREFIXES = tuple(sorted(FILE_PREFIX_MAP.items(), key=lambda item: -len(item[0])))
+
 # ─────────────────────────────────────────────
 # ROUTING TABLE
 # ─────────────────────────────────────────────
@@ -185,7 +200,7 @@ ROUTING_TABLE = [
     },
     {
         "keywords": ["crm", "lifecycle", "managed channels", "owned channels", "retention"],
-        "channels": ["email", "push_notification", "sms"],
+        "channels": GROUP_CHANNELS["lifecycle"],
     },
     # --- Organic ---
     {
@@ -225,11 +240,11 @@ ROUTING_TABLE = [
     # --- Group-Level ---
     {
         "keywords": ["paid", "paid channels", "paid media"],
-        "channels": ["sem", "brand_campaign", "display", "promoted_social", "metasearch", "affiliate"],
+        "channels": GROUP_CHANNELS["paid"],
     },
     {
         "keywords": ["organic", "organic channels"],
-        "channels": ["seo", "free_referral", "managed_social"],
+        "channels": GROUP_CHANNELS["organic"],
     },
     # --- All Channels ---
     {
@@ -266,77 +281,169 @@ TEMPLATE_RULES = {
 # STEP 1: CLASSIFY INTENT
 # ─────────────────────────────────────────────
 
-def classify_query(query: str) -> dict:
-    """Route a user query to the appropriate channel agents.
-
-    Returns:
-        {
-            "channels": ["sem", "display", ...],
-            "groups": ["paid", "lifecycle", ...],
-            "template": "templates/weekly-report.md",
-            "self_contained": False,
-            "all_channels": False,
-            "match_type": "keyword" | "fallback",
-            "date_range": {"current": "...", "prior": "..."} | None,
-            "comparison_type": "wow" | "mom" | "yoy",
-            "geo": "NA" | "INTL" | "ALL"
+@dataclass(slots=True, frozen=True)
+class ClassificationResult:
+    """Routing decision for a query (Step 1 output)."""
+
+    channels: tuple[str, ...]
+    groups: tuple[str, ...]
+    template: str
+    self_contained: bool
+    all_channels: bool
+    match_type: str  # keyword | fallback | explicit
+    date_range: tuple[str, str] | None  # (current_start, current_end)
+    comparison_type: str  # wow | mom | yoy
+    geo: str  # NA | INTL | ALL
+
+    def to_dict(self) -> dict:
+        return {
+            "channels": list(self.channels),
+            "groups": list(self.groups),
+            "template": self.template,
+            "self_contained": self.self_contained,
+            "all_channels": self.all_channels,
+            "match_type": self.match_type,
+            "date_range": ({"current_start": self.date_range[0], "current_end": self.date_range[1]}
+                           if self.date_range else None),
+            "comparison_type": self.comparison_type,
+            "geo": self.geo,
         }
+
+
+def _groups_for(channels) -> tuple[str, ...]:
+    """Return the distinct groups of the given channels, in first-seen order."""
+    return tuple(dict.fromkeys(g for ch in channels if (g := CHANNEL_GROUPS.get(ch))))
+
+
+def _build_keyword_index():
+    """Index every routing keyword for a single-pass scan of the query.
+
+    Returns (regex, prefixes, routes): the regex reports the longest
+    keyword starting at each position; prefixes maps that keyword to all
+    keywords that also match there; routes maps a keyword to the index of
+    every route listing it.
     """
+    routes = {}
+    for idx, route in enumerate(ROUTING_TABLE):
+        for kw in route["keywords"]:
+            routes.setdefault(kw, []).append(idx)
+    keywords = sorted(routes, key=len, reverse=True)
+    prefixes = {kw: tuple(k for k in keywords if kw.startswith(k)) for kw in keywords}
+    regex = re.compile("(?=(" + "|".join(re.escape(kw) for kw in keywords) + "))")
+    return regex, prefixes, {kw: tuple(idxs) for kw, idxs in routes.items()}
+
+
+_KEYWORD_RE, _KEYWORD_PREFIXES, _KEYWORD_ROUTES = _build_keyword_index()
+
+
+def classify_query(query: str) -> ClassificationResult:
+    """Route a user query to the appropriate channel agents."""
     query_lower = query.lower().strip()
 
-    # Keyword matching
-    best_match = None
-    best_match_count = 0
+    # Keyword matching: each distinct keyword found counts once per route listing it
+    hits = set()
+    for m in _KEYWORD_RE.finditer(query_lower):
+        hits.update(_KEYWORD_PREFIXES[m.group(1)])
+    counts = [0] * len(ROUTING_TABLE)
+    for kw in hits:
+        for idx in _KEYWORD_ROUTES[kw]:
+            counts[idx] += 1
 
-    for route in ROUTING_TABLE:
-        match_count = sum(1 for kw in route["keywords"] if kw in query_lower)
-        if match_count > best_match_count:
-            best_match = route
-            best_match_count = match_count
+    best_match = None
+    best_match_count = max(counts, default=0)
+    if best_match_count > 0:
+        best_match = ROUTING_TABLE[counts.index(best_match_count)]
 
     if best_match and best_match_count > 0:
-        channels = best_match["channels"]
-        groups = list(set(CHANNEL_GROUPS.get(ch, "") for ch in channels if ch in CHANNEL_GROUPS))
-        result = {
+        channels = tuple(best_match["channels"])
+        match = {
             "channels": channels,
-            "groups": [g for g in groups if g],
+            "groups": _groups_for(channels),
             "self_contained": best_match.get("self_contained", False),
             "all_channels": best_match.get("all_channels", False),
             "match_type": "keyword",
         }
     else:
         # Fallback: no keyword match. Default to listing available data.
-        result = {
-            "channels": [],
-            "groups": [],
+        match = {
+            "channels": (),
+            "groups": (),
             "self_contained": False,
             "all_channels": False,
             "match_type": "fallback",
         }
 
-    # Determine template
-    result["template"] = select_template(query_lower)
+    return ClassificationResult(**match, **_scan_query(query_lower))
+
+
+_COMPARISON_KEYWORDS = {
+    "yoy": ["yoy", "year over year", "vs last year", "year-over-year"],
+    "mom": ["mom", "month over month", "vs last month", "month-over-month"],
+}
+_GEO_PATTERNS = {
+    "INTL": [re.escape(kw) for kw in ["intl", "international", "non-us", "global"]],
+    "NA": [r"\bna\b"] + [re.escape(kw) for kw in ["north america", "us only", "domestic"]],
+}
+_TEMPLATE_KEYWORDS = [kw for kw in TEMPLATE_RULES if kw != "default"]
+
+# Every template, date, comparison and geo cue as one zero-width alternation,
+# so a single finditer walks the query once and reports hits without
+# consuming characters (overlapping cues like " vs " and "vs last year"
+# are both seen).
+_QUERY_SCAN_RE = re.compile("(?=(?:" + "|".join(
+    [f"(?P<tpl{i}>{re.escape(kw)})" for i, kw in enumerate(_TEMPLATE_KEYWORDS)]
+    + [r"(?P<date>(?P<start>\d{4}-\d{2}-\d{2})\s*(?:to|through|thru|-)\s*(?P<end>\d{4}-\d{2}-\d{2}))"]
+    + [f"(?P<{name}>{'|'.join(re.escape(kw) for kw in kws)})" for name, kws in _COMPARISON_KEYWORDS.items()]
+    + [f"(?P<geo_{geo.lower()}>{'|'.join(pats)})" for geo, pats in _GEO_PATTERNS.items()]
+) + "))")
+
+
+_EMPTY_QUERY_FIELDS = {
+    "template": TEMPLATE_RULES["default"],
+    "date_range": None,
+    "comparison_type": "wow",
+    "geo": "ALL",
+}
 
-    # Parse date range from query
-    result["date_range"] = parse_date_range(query_lower)
 
-    # Parse comparison type
-    result["comparison_type"] = parse_comparison_type(query_lower)
+def _scan_query(query_lower: str) -> dict:
+    """Extract template, date range, comparison type and geo in one pass.
 
-    # Parse geo filter
-    result["geo"] = parse_geo(query_lower)
+    Precedence matches the individual rules: template keywords in
+    TEMPLATE_RULES order, first date range in the query, yoy over mom,
+    INTL over NA.
+    """
+    if not query_lower:
+        # Common with --channels and no query: nothing to scan
+        return dict(_EMPTY_QUERY_FIELDS)
+    template_hits = set()
+    date_range = None
+    hits = set()
+    for m in _QUERY_SCAN_RE.finditer(query_lower):
+        name = m.lastgroup
+        if name == "date":
+            if date_range is None:
+                date_range = (m.group("start"), m.group("end"))
+        elif name.startswith("tpl"):
+            template_hits.add(int(name[3:]))
+        else:
+            hits.add(name)
 
-    return result
+    template = next(
+        (TEMPLATE_RULES[kw] for i, kw in enumerate(_TEMPLATE_KEYWORDS) if i in template_hits),
+        TEMPLATE_RULES["default"],
+    )
+    return {
+        "template": template,
+        "date_range": date_range,
+        "comparison_type": next((c for c in _COMPARISON_KEYWORDS if c in hits), "wow"),
+        "geo": next((g for g in _GEO_PATTERNS if f"geo_{g.lower()}" in hits), "ALL"),
+    }
 
 
 def select_template(query_lower: str) -> str:
     """Select output template based on query keywords."""
-    for keyword, template in TEMPLATE_RULES.items():
-        if keyword == "default":
-            continue
-        if keyword in query_lower:
-            return template
-    return TEMPLATE_RULES["default"]
+    return _scan_query(query_lower)["template"]
 
 
 def select_template_from_results(query_lower: str, channel_outputs: list[dict]) -> str:
@@ -357,54 +464,122 @@ def select_template_from_results(query_lower: str, channel_outputs: list[dict])
     return template
 
 
-def parse_date_range(query: str) -> dict | None:
-    """Extract date range from query string."""
-    iso_pattern = r"(\d{4}-\d{2}-\d{2})\s*(?:to|through|thru|-)\s*(\d{4}-\d{2}-\d{2})"
-    match = re.search(iso_pattern, query)
-    if match:
-        return {"current_start": match.group(1), "current_end": match.group(2)}
-    return None
+def parse_date_range(query: str) -> tuple[str, str] | None:
+    """Extract (current_start, current_end) from query string."""
+    return _scan_query(query)["date_range"]
+
+
+_PERIOD_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})/(\d{4})-(\d{2})-(\d{2})$")
+
+
+def parse_period(value: str) -> tuple[date, date]:
+    """Parse a --period value (YYYY-MM-DD/YYYY-MM-DD) into (start, end) dates.
+
+    Raises ValueError on a malformed value or a start after the end.
+    """
+    m = _PERIOD_RE.match(value.strip())
+    if not m:
+        raise ValueError(f"invalid period {value!r}: expected YYYY-MM-DD/YYYY-MM-DD")
+    start = date(int(m[1]), int(m[2]), int(m[3]))
+    end = date(int(m[4]), int(m[5]), int(m[6]))
+    if start > end:
+        raise ValueError(f"invalid period {value!r}: start is after end")
+    return start, end
 
 
 def parse_comparison_type(query: str) -> str:
     """Determine comparison type from query."""
-    if any(kw in query for kw in ["yoy", "year over year", "vs last year", "year-over-year"]):
-        return "yoy"
-    if any(kw in query for kw in ["mom", "month over month", "vs last month", "month-over-month"]):
-        return "mom"
-    return "wow"  # Default: week-over-week
+    return _scan_query(query)["comparison_type"]  # Default: week-over-week
 
 
 def parse_geo(query: str) -> str:
     """Determine geography filter from query."""
-    if any(kw in query for kw in ["intl", "international", "non-us", "global"]):
-        return "INTL"
-    if re.search(r"\bna\b", query) or any(kw in query for kw in ["north america", "us only", "domestic"]):
-        return "NA"
-    return "ALL"
+    return _scan_query(query)["geo"]
 
 
 # ─────────────────────────────────────────────
 # STEP 2: PREPROCESS
 # ─────────────────────────────────────────────
 
+def _import_script(name: str):
+    """Import a module from scripts/ so it runs in-process instead of via subprocess."""
+    import importlib
+
+    return importlib.import_module(name)  # SCRIPTS_DIR is put on sys.path at import time
+
+
+# Bump when preprocess output format changes to invalidate cached runs
+PREPROCESS_CACHE_VERSION = 1
+PREPROCESS_CACHE_DIR = DATA_PIPELINE / ".preprocess_cache"
+# Only the latest run is kept: a new fingerprint overwrites the previous entry
+PREPROCESS_CACHE_FILE = PREPROCESS_CACHE_DIR / "latest.json"
+
+
+def _preprocess_fingerprint() -> str:
+    """Hash input file names, mtimes and sizes plus the preprocessor itself."""
+    import hashlib
+
+    inputs = []
+    for root, _dirs, files in os.walk(DATA_INPUT):
+        for name in files:
+            st = os.stat(os.path.join(root, name))
+            inputs.append((os.path.relpath(os.path.join(root, name), DATA_INPUT), st.st_mtime_ns, st.st_size))
+    script = os.stat(SCRIPTS_DIR / "preprocess.py")
+    key = {
+        "version": PREPROCESS_CACHE_VERSION,
+        "script": (script.st_mtime_ns, script.st_size),
+        "inputs": sorted(inputs),
+    }
+    return hashlib.blake2b(json.dumps(key, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def _load_cached_preprocess(fingerprint: str) -> list | None:
+    """Return the cached preprocess result if it matches fingerprint and every output file still exists."""
+    try:
+        with open(PREPROCESS_CACHE_FILE, "rb") as f:
+            entry = load_json(f.read())
+        if entry["fingerprint"] != fingerprint:
+            return None
+        cached = entry["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    for r in cached:
+        if not all(os.path.exists(p) for p in r.get("output_files", [])):
+            return None
+    return cached
+
+
 def run_preprocessor(dry_run: bool = False) -> dict:
-    """Run the preprocessing script on new input files."""
-    cmd = [sys.executable, str(SCRIPTS_DIR / "preprocess.py"), "--json"]
-    if dry_run:
-        cmd.append("--dry-run")
+    """Run the preprocessor in-process on new input files.
+
+    Results are cached by a fingerprint of /data/input/, so re-running
+    with unchanged inputs (including with --dry-run) skips the
+    preprocessor entirely.
+    """
+    try:
+        fingerprint = _preprocess_fingerprint()
+    except OSError:
+        fingerprint = None
+    if fingerprint is not None:
+        # A hit also answers --dry-run: the inputs would produce exactly this
+        cached = _load_cached_preprocess(fingerprint)
+        if cached is not None:
+            return cached
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if result.returncode != 0:
-            return {"status": "error", "error": result.stderr}
-        return json.loads(result.stdout) if result.stdout.strip() else {"status": "no_output"}
-    except subprocess.TimeoutExpired:
-        return {"status": "error", "error": "Preprocessor timed out after 120s"}
-    except json.JSONDecodeError:
-        return {"status": "error", "error": f"Invalid JSON from preprocessor: {result.stdout[:200]}"}
-    except FileNotFoundError:
-        return {"status": "error", "error": "Preprocessor script not found. Run from project root."}
+        output = _import_script("preprocess").run_preprocessing(dry_run=dry_run)
+    except Exception:
+        import traceback
+
+        return {"status": "error", "error": traceback.format_exc()}
+
+    if fingerprint is not None and not dry_run and isinstance(output, list):
+        try:
+            PREPROCESS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            write_atomic(PREPROCESS_CACHE_FILE, dump_json({"fingerprint": fingerprint, "result": output}))
+        except OSError:
+            pass
+    return output
 
 
 # ─────────────────────────────────────────────
@@ -413,19 +588,12 @@ def run_preprocessor(dry_run: bool = False) -> dict:
 
 def run_validation() -> dict:
     """Run data quality validation. Returns gate decision."""
-    cmd = [sys.executable, str(SCRIPTS_DIR / "validate_data.py"), "--json"]
-
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if result.returncode != 0:
-            return {"gate_decision": "BLOCK", "error": result.stderr}
-        return json.loads(result.stdout) if result.stdout.strip() else {"gate_decision": "PROCEED"}
-    except subprocess.TimeoutExpired:
-        return {"gate_decision": "BLOCK", "error": "Validation timed out after 120s"}
-    except json.JSONDecodeError:
-        return {"gate_decision": "BLOCK", "error": f"Invalid JSON from validator: {result.stdout[:200]}"}
-    except FileNotFoundError:
-        return {"gate_decision": "BLOCK", "error": "Validation script not found. Run from project root."}
+        return _import_script("validate_data").run_validation()
+    except Exception:
+        import traceback
+
+        return {"gate_decision": "BLOCK", "error": traceback.format_exc()}
 
 
 # ─────────────────────────────────────────────
@@ -435,20 +603,27 @@ def run_validation() -> dict:
 def get_available_data() -> dict[str, list[str]]:
     """Scan /data/validated/ for available data files, grouped by channel."""
     available = {}
-    if not DATA_VALIDATED.exists():
+    try:
+        entries = os.scandir(DATA_VALIDATED)
+    except FileNotFoundError:
         return available
 
-    for f in DATA_VALIDATED.glob("*.csv"):
-        name = f.name.lower()
-        for prefix, channel in FILE_PREFIX_MAP.items():
-            if name.startswith(prefix):
-                available.setdefault(channel, []).append(str(f))
-                break
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".csv") or not entry.is_file():
+                continue
+            name = entry.name.lower()
+            # Standardized names are {source}_{geo}_..., so the first token is usually an exact key
+            channel = FILE_PREFIX_MAP.get(name.split("_", 1)[0])
+            if channel is None:
+                channel = next((ch for prefix, ch in _FILE_PREFIXES if name.startswith(prefix)), None)
+            if channel:
+                available.setdefault(channel, []).append(entry.path)
 
     return available
 
 
-def filter_channels_by_data(requested_channels: list[str], available_data: dict) -> tuple[list[str], list[str]]:
+def filter_channels_by_data(requested_channels: Iterable[str], available_data: dict) -> tuple[list[str], list[str]]:
     """Filter requested channels to only those with available data.
 
     Returns:
@@ -482,81 +657,139 @@ def determine_synthesis_levels(active_channels: list[str]) -> tuple[list[str], b
         if len(channels) >= 2 and GROUP_SYNTHESIS_MAP.get(group):
             group_synthesis.append(group)
 
-    # Top-level synthesis: run if 2+ groups are active
-    active_groups = set(channels_per_group.keys())
-    needs_top_synthesis = len(active_groups) >= 2
+    # Top-level synthesis: run if 2+ groups are active (keys are already distinct)
+    needs_top_synthesis = len(channels_per_group) >= 2
 
     return group_synthesis, needs_top_synthesis
 
 
-def build_agent_context(channel: str, classification: dict) -> dict:
-    """Build the context payload for a channel sub-agent.
-
-    Returns a dict with only the relevant prompt, config, memory, and data
-    for this specific channel — not the full payload.
-    """
-    context = {
+@dataclass(slots=True, frozen=True)
+class AgentContext:
+    """Context payload for a single channel sub-agent."""
+
+    channel: str
+    channel_group: str | None
+    agent_prompt: str | None
+    metrics_yaml: str
+    thresholds_yaml: str
+    benchmarks_yaml: str
+    baselines: str
+    known_issues: str
+    context_md: str
+    data_files: tuple[str, ...]
+    date_range: tuple[str, str] | None
+    comparison_type: str
+    geo: str
+    output_schema: str
+
+
+# Reference paths shared by every agent prompt, stringified once
+_METRICS_YAML = str(CONFIG_DIR / "metrics.yaml")
+_THRESHOLDS_YAML = str(CONFIG_DIR / "thresholds.yaml")
+_BENCHMARKS_YAML = str(CONFIG_DIR / "benchmarks.yaml")
+_CONTEXT_MD = str(MEMORY_DIR / "context.md")
+_KNOWN_ISSUES_MD = str(MEMORY_DIR / "known-issues.md")
+_DECISIONS_LOG_MD = str(MEMORY_DIR / "decisions-log.md")
+_CHANNEL_OUTPUT_SCHEMA = str(SCHEMAS_DIR / "channel-output.json")
+_GROUP_SYNTHESIS_SCHEMA = str(SCHEMAS_DIR / "group-synthesis-output.json")
+_HYPOTHESIS_SCHEMA = str(SCHEMAS_DIR / "hypothesis-output.json")
+_SYNTHESIS_SCHEMA = str(SCHEMAS_DIR / "synthesis-output.json")
+
+
+def _static_agent_context(channel: str) -> dict:
+    """Return the request-independent AgentContext fields for a channel."""
+    return {
         "channel": channel,
         "channel_group": CHANNEL_GROUPS.get(channel),
         "agent_prompt": CHANNEL_AGENT_MAP.get(channel),
-        "config": {
-            "metrics": str(CONFIG_DIR / "metrics.yaml"),
-            "thresholds": str(CONFIG_DIR / "thresholds.yaml"),
-            "benchmarks": str(CONFIG_DIR / "benchmarks.yaml"),
-        },
-        "memory": {
-            "baselines": str(PROJECT_ROOT / CHANNEL_BASELINE_MAP.get(channel, "")),
-            "known_issues": str(MEMORY_DIR / "known-issues.md"),
-            "context": str(MEMORY_DIR / "context.md"),
-        },
-        "data_files": get_available_data().get(channel, []),
-        "date_range": classification.get("date_range"),
-        "comparison_type": classification.get("comparison_type", "wow"),
-        "geo": classification.get("geo", "ALL"),
-        "output_schema": str(SCHEMAS_DIR / "channel-output.json"),
+        "metrics_yaml": _METRICS_YAML,
+        "thresholds_yaml": _THRESHOLDS_YAML,
+        "benchmarks_yaml": _BENCHMARKS_YAML,
+        "baselines": str(PROJECT_ROOT / CHANNEL_BASELINE_MAP.get(channel, "")),
+        "known_issues": _KNOWN_ISSUES_MD,
+        "context_md": _CONTEXT_MD,
+        "output_schema": _CHANNEL_OUTPUT_SCHEMA,
     }
 
-    return context
 
+# Paths never change within a process, so resolve them once per channel
+_STATIC_CTX_PER_CHANNEL = {ch: _static_agent_context(ch) for ch in CHANNEL_AGENT_MAP}
 
-def build_subagent_prompt(channel: str, context: dict) -> str:
-    """Build the prompt string for a channel sub-agent."""
-    prompt = f"""You are the {channel.upper()} channel analysis agent.
+
+def build_agent_context(channel: str, classification: ClassificationResult,
+                        available: dict[str, list[str]] | None = None) -> AgentContext:
+    """Build the context payload for a channel sub-agent.
+
+    Holds only the relevant prompt, config, memory, and data for this
+    specific channel — not the full payload. Pass ``available`` (from
+    get_available_data) to avoid rescanning data/validated per channel.
+    """
+    static = _STATIC_CTX_PER_CHANNEL.get(channel) or _static_agent_context(channel)
+    if available is None:
+        available = get_available_data()
+    return AgentContext(
+        **static,
+        data_files=tuple(available.get(channel, [])),
+        date_range=classification.date_range,
+        comparison_type=classification.comparison_type,
+        geo=classification.geo,
+    )
+
+
+@lru_cache(maxsize=64)
+def _subagent_prompt_prelude(channel: str, channel_group: str | None, agent_prompt: str | None,
+                             metrics_yaml: str, thresholds_yaml: str, benchmarks_yaml: str,
+                             baselines: str, known_issues: str, context_md: str) -> str:
+    """Render the request-independent head of a channel sub-agent prompt."""
+    return f"""You are the {channel.upper()} channel analysis agent.
 
 ## Instructions
 Read your agent prompt file and follow its analysis process exactly.
 
 ## Agent Prompt
-Read: {context['agent_prompt']}
+Read: {agent_prompt}
 
 ## Channel Group
-This channel belongs to the **{context.get('channel_group', 'unknown')}** group.
+This channel belongs to the **{channel_group}** group.
 
 ## Reference Files (read these before analysis)
-- Metrics definitions: {context['config']['metrics']}
-- Thresholds: {context['config']['thresholds']}
-- Benchmarks: {context['config']['benchmarks']}
-- Baselines: {context['memory']['baselines']}
-- Known issues: {context['memory']['known_issues']}
-- Business context: {context['memory']['context']}
+- Metrics definitions: {metrics_yaml}
+- Thresholds: {thresholds_yaml}
+- Benchmarks: {benchmarks_yaml}
+- Baselines: {baselines}
+- Known issues: {known_issues}
+- Business context: {context_md}
+"""
+
 
+def build_subagent_prompt(channel: str, context: AgentContext) -> str:
+    """Build the prompt string for a channel sub-agent."""
+    date_range = (f"{context.date_range[0]} to {context.date_range[1]}"
+                  if context.date_range else "Use most recent complete period")
+    data_files = "\n".join(f"- {f}" for f in context.data_files)
+    prelude = _subagent_prompt_prelude(
+        channel, context.channel_group, context.agent_prompt,
+        context.metrics_yaml, context.thresholds_yaml, context.benchmarks_yaml,
+        context.baselines, context.known_issues, context.context_md,
+    )
+    prompt = prelude + f"""
 ## Data Files
-{chr(10).join(f'- {f}' for f in context['data_files'])}
+{data_files}
 
 ## Analysis Parameters
-- Comparison type: {context['comparison_type']}
-- Geo filter: {context['geo']}
-- Date range: {context.get('date_range') or 'Use most recent complete period'}
+- Comparison type: {context.comparison_type}
+- Geo filter: {context.geo}
+- Date range: {date_range}
 
 ## Output Requirements
-Your output MUST be valid JSON conforming to the schema at {context['output_schema']}.
+Your output MUST be valid JSON conforming to the schema at {context.output_schema}.
 
 Read the schema file, then produce a JSON output with these fields:
 - channel: "{channel}"
-- channel_group: "{context.get('channel_group')}"
+- channel_group: "{context.channel_group}"
 - geo: your geo filter
 - period: "YYYY-MM-DD/YYYY-MM-DD"
-- comparison_type: "{context['comparison_type']}"
+- comparison_type: "{context.comparison_type}"
 - summary: array of metric objects (metric, current, prior, delta_pct, benchmark, status)
 - top_movers: array of top 5 movers (rank, segment, metric, change_pct, likely_cause)
 - anomalies: array of detected anomalies (metric, segment, z_score, direction, value, baseline)
@@ -565,14 +798,14 @@ Read the schema file, then produce a JSON output with these fields:
 - extended_metrics: object with channel-specific KPIs (for CRM: open_rate, click_rate, etc.)
 
 Read the data files, perform your analysis, and return ONLY the JSON output.
-Write the JSON output to: {str(DATA_PIPELINE / f'{channel}_output.json')}
+Write the JSON output to: {DATA_PIPELINE / f'{channel}_output.json'}
 """
     return prompt
 
 
 def build_group_synthesis_prompt(group: str, channel_outputs: list[dict]) -> str:
     """Build the prompt for a group synthesis sub-agent."""
-    outputs_json = json.dumps(channel_outputs, indent=2)
+    outputs_json = dump_json(channel_outputs).decode()
     synthesis_agent = GROUP_SYNTHESIS_MAP.get(group)
 
     prompt = f"""You are the {group.upper()} Group Synthesis Agent.
@@ -581,9 +814,9 @@ def build_group_synthesis_prompt(group: str, channel_outputs: list[dict]) -> str
 Read your agent prompt: {synthesis_agent}
 
 ## Reference Files
-- Metrics definitions: {str(CONFIG_DIR / 'metrics.yaml')}
-- Benchmarks: {str(CONFIG_DIR / 'benchmarks.yaml')}
-- Business context: {str(MEMORY_DIR / 'context.md')}
+- Metrics definitions: {_METRICS_YAML}
+- Benchmarks: {_BENCHMARKS_YAML}
+- Business context: {_CONTEXT_MD}
 
 ## Channel Analysis Results for {group.upper()} Group
 ```json
@@ -591,7 +824,7 @@ Read your agent prompt: {synthesis_agent}
 ```
 
 ## Output Requirements
-Your output MUST be valid JSON conforming to: {str(SCHEMAS_DIR / 'group-synthesis-output.json')}
+Your output MUST be valid JSON conforming to: {_GROUP_SYNTHESIS_SCHEMA}
 
 Produce JSON with:
 - group: "{group}"
@@ -600,14 +833,14 @@ Produce JSON with:
 - contradictions: any data conflicts within the group
 - actions: top 3 ICE-scored actions scoped to this group
 
-Write the JSON output to: {str(DATA_PIPELINE / f'{group}_group_synthesis_output.json')}
+Write the JSON output to: {DATA_PIPELINE / f'{group}_group_synthesis_output.json'}
 """
     return prompt
 
 
 def build_hypothesis_prompt(channel_outputs: list[dict]) -> str:
     """Build the prompt for the hypothesis sub-agent."""
-    outputs_json = json.dumps(channel_outputs, indent=2)
+    outputs_json = dump_json(channel_outputs).decode()
 
     prompt = f"""You are the Hypothesis Agent.
 
@@ -615,11 +848,11 @@ def build_hypothesis_prompt(channel_outputs: list[dict]) -> str:
 Read your agent prompt: agents/hypothesis.md
 
 ## Reference Files
-- Known issues: {str(MEMORY_DIR / 'known-issues.md')}
-- Business context: {str(MEMORY_DIR / 'context.md')}
-- Decisions log: {str(MEMORY_DIR / 'decisions-log.md')}
-- Benchmarks: {str(CONFIG_DIR / 'benchmarks.yaml')}
-- Thresholds: {str(CONFIG_DIR / 'thresholds.yaml')}
+- Known issues: {_KNOWN_ISSUES_MD}
+- Business context: {_CONTEXT_MD}
+- Decisions log: {_DECISIONS_LOG_MD}
+- Benchmarks: {_BENCHMARKS_YAML}
+- Thresholds: {_THRESHOLDS_YAML}
 
 ## Channel Analysis Results
 ```json
@@ -627,7 +860,7 @@ Read your agent prompt: agents/hypothesis.md
 ```
 
 ## Output Requirements
-Your output MUST be valid JSON conforming to: {str(SCHEMAS_DIR / 'hypothesis-output.json')}
+Your output MUST be valid JSON conforming to: {_HYPOTHESIS_SCHEMA}
 
 Read the schema, then produce JSON with:
 - hypotheses: array of hypothesis objects for each significant metric move
@@ -635,15 +868,15 @@ Read the schema, then produce JSON with:
 For each metric with delta_pct > 5% (from thresholds.yaml minimum_delta_to_flag), generate 1-3 hypotheses.
 Check memory files FIRST: known issues should be the first hypothesis considered.
 
-Write the JSON output to: {str(DATA_PIPELINE / 'hypothesis_output.json')}
+Write the JSON output to: {DATA_PIPELINE / 'hypothesis_output.json'}
 """
     return prompt
 
 
 def build_top_synthesis_prompt(group_synthesis_outputs: list[dict], hypothesis_output: dict) -> str:
     """Build the prompt for the top-level cross-group synthesis sub-agent."""
-    groups_json = json.dumps(group_synthesis_outputs, indent=2)
-    hypothesis_json = json.dumps(hypothesis_output, indent=2)
+    groups_json = dump_json(group_synthesis_outputs).decode()
+    hypothesis_json = dump_json(hypothesis_output).decode()
 
     prompt = f"""You are the Top-Level Cross-Group Synthesis Agent.
 
@@ -651,8 +884,8 @@ def build_top_synthesis_prompt(group_synthesis_outputs: list[dict], hypothesis_o
 Read your agent prompt: agents/cross-channel/synthesis.md
 
 ## Reference Files
-- Metrics definitions: {str(CONFIG_DIR / 'metrics.yaml')}
-- Business context: {str(MEMORY_DIR / 'context.md')}
+- Metrics definitions: {_METRICS_YAML}
+- Business context: {_CONTEXT_MD}
 
 ## Group Synthesis Results
 ```json
@@ -665,7 +898,7 @@ Read your agent prompt: agents/cross-channel/synthesis.md
 ```
 
 ## Output Requirements
-Your output MUST be valid JSON conforming to: {str(SCHEMAS_DIR / 'synthesis-output.json')}
+Your output MUST be valid JSON conforming to: {_SYNTHESIS_SCHEMA}
 
 Produce JSON with:
 - groups: array of group summary cards
@@ -674,7 +907,7 @@ Produce JSON with:
 - contradictions: any cross-group data conflicts
 - actions: top 5 ICE-scored action items across all groups
 
-Write the JSON output to: {str(DATA_PIPELINE / 'synthesis_output.json')}
+Write the JSON output to: {DATA_PIPELINE / 'synthesis_output.json'}
 """
     return prompt
 
@@ -683,6 +916,35 @@ Write the JSON output to: {str(DATA_PIPELINE / 'synthesis_output.json')}
 # OUTPUT VALIDATION
 # ─────────────────────────────────────────────
 
+# Below this many summary rows the plain Python cross-check beats building arrays
+_VECTORIZE_DELTA_MIN_ROWS = 64
+
+
+def _delta_mismatches(summary: list[dict]) -> dict[int, float]:
+    """Map summary index -> expected delta_pct for rows whose delta_pct is off by more than 1pt."""
+    if len(summary) < _VECTORIZE_DELTA_MIN_ROWS:
+        mismatches = {}
+        for i, item in enumerate(summary):
+            if item.get("current") is not None and item.get("prior") is not None and item["prior"] != 0:
+                expected_delta = ((item["current"] - item["prior"]) / abs(item["prior"])) * 100
+                actual_delta = item.get("delta_pct")
+                if actual_delta is not None and abs(expected_delta - actual_delta) > 1:
+                    mismatches[i] = expected_delta
+        return mismatches
+
+    import numpy as np
+
+    def column(key):
+        return np.array([np.nan if item.get(key) is None else item[key] for item in summary],
+                        dtype=np.float64)
+
+    current, prior, actual = column("current"), column("prior"), column("delta_pct")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = np.where(prior != 0, (current - prior) / np.abs(prior) * 100.0, np.nan)
+    mask = np.isfinite(expected) & ~np.isnan(actual) & (np.abs(expected - actual) > 1)
+    return {int(i): float(expected[i]) for i in np.flatnonzero(mask)}
+
+
 def validate_channel_output(output: dict) -> list[str]:
     """Validate a channel agent output against quality rules.
 
@@ -700,6 +962,7 @@ def validate_channel_output(output: dict) -> list[str]:
     if not summary:
         errors.append("Summary array is empty (need at least 1 metric)")
 
+    mismatches = _delta_mismatches(summary)
     for i, item in enumerate(summary):
         if "metric" not in item:
             errors.append(f"summary[{i}]: missing 'metric' field")
@@ -711,14 +974,11 @@ def validate_channel_output(output: dict) -> list[str]:
             errors.append(f"summary[{i}]: invalid status '{item['status']}'")
 
         # Cross-check delta_pct calculation
-        if item.get("current") is not None and item.get("prior") is not None and item["prior"] != 0:
-            expected_delta = ((item["current"] - item["prior"]) / abs(item["prior"])) * 100
-            actual_delta = item.get("delta_pct")
-            if actual_delta is not None and abs(expected_delta - actual_delta) > 1:
-                errors.append(
-                    f"summary[{i}] ({item.get('metric', '?')}): delta_pct mismatch. "
-                    f"Expected ~{expected_delta:.1f}%, got {actual_delta}%"
-                )
+        if i in mismatches:
+            errors.append(
+                f"summary[{i}] ({item.get('metric', '?')}): delta_pct mismatch. "
+                f"Expected ~{mismatches[i]:.1f}%, got {item.get('delta_pct')}%"
+            )
 
     # Top movers: need at least 1
     if not output.get("top_movers"):
@@ -751,15 +1011,23 @@ def update_decisions_log(actions: list[dict], analysis_source: str):
         new_entries.append(entry)
 
     if new_entries:
-        with open(log_path, "a") as f:
-            for entry in new_entries:
-                f.write(entry + "\n")
+        # One O_APPEND write keeps entries from concurrent runs from interleaving
+        payload = ("\n".join(new_entries) + "\n").encode()
+        fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
 
 
 # ─────────────────────────────────────────────
 # AUTO-EXECUTION VIA ORCHESTRATOR
 # ─────────────────────────────────────────────
 
+# Each agent is its own process; bound in-flight agents by cores, capped at 16
+MAX_CONCURRENT_AGENTS = min(os.cpu_count() or 4, 16)
+
+
 def _try_import_orchestrator():
     """Try to import the shared orchestrator. Returns module or None."""
     orchestrator_path = Path(__file__).resolve().parent.parent.parent / "shared" / "lib"
@@ -782,6 +1050,8 @@ def _auto_execute_agents(active_channels, classification, group_synthesis_groups
         print("\n  Orchestrator not available (shared/lib/orchestrator.py). Falling back to manual mode.")
         return False
 
+    import logging
+
     logger = logging.getLogger(__name__)
     project_dir = str(PROJECT_ROOT)
 
@@ -800,7 +1070,8 @@ def _auto_execute_agents(active_channels, classification, group_synthesis_groups
             timeout=300,
         ))
 
-    channel_results = orch.run_parallel(channel_tasks, max_concurrent=3)
+    channel_results = orch.run_parallel(
+        channel_tasks, max_concurrent=min(len(channel_tasks), MAX_CONCURRENT_AGENTS))
     channel_outputs = []
 
     for task, result in zip(channel_tasks, channel_results):
@@ -809,18 +1080,18 @@ def _auto_execute_agents(active_channels, classification, group_synthesis_groups
             output_file = DATA_PIPELINE / f"{task.name}_output.json"
             if output_file.exists():
                 try:
-                    with open(output_file) as f:
-                        channel_outputs.append(json.load(f))
+                    with open(output_file, "rb") as f:
+                        channel_outputs.append(load_json(f.read()))
                     print(f"    {task.name}: OK ({result.duration_seconds:.1f}s)")
                     continue
                 except json.JSONDecodeError:
                     pass
             # Try parsing from stdout
             try:
-                parsed = json.loads(result.output)
+                parsed = load_json(result.output)
                 channel_outputs.append(parsed)
-                with open(output_file, "w") as f:
-                    json.dump(parsed, f, indent=2)
+                with open(output_file, "wb") as f:
+                    f.write(dump_json(parsed))
                 print(f"    {task.name}: OK ({result.duration_seconds:.1f}s)")
             except (json.JSONDecodeError, ValueError):
                 print(f"    {task.name}: OK but non-JSON output ({result.duration_seconds:.1f}s)")
@@ -851,7 +1122,8 @@ def _auto_execute_agents(active_channels, classification, group_synthesis_groups
                 timeout=240,
             ))
 
-        group_results = orch.run_parallel(group_tasks, max_concurrent=3)
+        group_results = orch.run_parallel(
+            group_tasks, max_concurrent=min(len(group_tasks), MAX_CONCURRENT_AGENTS))
         for task, result in zip(group_tasks, group_results):
             status = "OK" if result.exit_code == 0 else "FAILED"
             print(f"    {task.name}: {status} ({result.duration_seconds:.1f}s)")
@@ -880,8 +1152,8 @@ def _auto_execute_agents(active_channels, classification, group_synthesis_groups
             syn_file = DATA_PIPELINE / f"{group}_group_synthesis_output.json"
             if syn_file.exists():
                 try:
-                    with open(syn_file) as f:
-                        group_syn_outputs.append(json.load(f))
+                    with open(syn_file, "rb") as f:
+                        group_syn_outputs.append(load_json(f.read()))
                 except json.JSONDecodeError:
                     pass
 
@@ -889,8 +1161,8 @@ def _auto_execute_agents(active_channels, classification, group_synthesis_groups
         hyp_file = DATA_PIPELINE / "hypothesis_output.json"
         if hyp_file.exists():
             try:
-                with open(hyp_file) as f:
-                    hyp_output = json.load(f)
+                with open(hyp_file, "rb") as f:
+                    hyp_output = load_json(f.read())
             except json.JSONDecodeError:
                 pass
 
@@ -914,8 +1186,29 @@ def _auto_execute_agents(active_channels, classification, group_synthesis_groups
 # MAIN PIPELINE
 # ─────────────────────────────────────────────
 
-def run_pipeline(query: str = "", channels: list[str] | None = None,
-                 period: str | None = None, skip_preprocess: bool = False,
+def _write_prompt(path: Path, text: str) -> bool:
+    """Write a prompt file unless it already holds exactly this text.
+
+    Re-running an unchanged query then leaves prompt files (and their
+    mtimes) untouched. Returns True if the file was written.
+    """
+    data = text.encode("utf-8")
+    try:
+        if os.stat(path).st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _skip_write(path: Path, text: str) -> bool:
+    """Stand-in for _write_prompt under --dry-run: writes nothing."""
+    return False
+
+
+def run_pipeline(query: str = "", channels: list[str] | tuple[str, ...] | None = None,
+                 period: tuple[date, date] | str | None = None, skip_preprocess: bool = False,
                  preprocess_only: bool = False, dry_run: bool = False) -> dict:
     """Execute the full 9-step analysis pipeline.
 
@@ -928,36 +1221,45 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
         "started_at": datetime.now().isoformat(),
     }
 
-    # Ensure pipeline directory exists
-    DATA_PIPELINE.mkdir(parents=True, exist_ok=True)
+    # --dry-run still builds every prompt but writes none of them
+    if dry_run:
+        write_prompt = _skip_write
+        wrote = "Would write"
+    else:
+        DATA_PIPELINE.mkdir(parents=True, exist_ok=True)
+        write_prompt = _write_prompt
+        wrote = "Wrote"
 
     # ── Step 1: Classify ──
     print("\n[1/9] CLASSIFY — Determining analysis intent...")
+    if isinstance(period, str):
+        period = parse_period(period)
+    period_range = (period[0].isoformat(), period[1].isoformat()) if period else None
     if channels:
-        groups = list(set(CHANNEL_GROUPS.get(ch, "") for ch in channels if ch in CHANNEL_GROUPS))
-        classification = {
-            "channels": channels,
-            "groups": [g for g in groups if g],
-            "self_contained": False,
-            "all_channels": False,
-            "match_type": "explicit",
-            "template": select_template(query.lower()),
-            "date_range": parse_date_range(period or ""),
-            "comparison_type": parse_comparison_type(query.lower()),
-            "geo": parse_geo(query.lower()),
-        }
+        scanned = _scan_query(query.lower())
+        scanned["date_range"] = period_range
+        classification = ClassificationResult(
+            channels=tuple(channels),
+            groups=_groups_for(channels),
+            self_contained=False,
+            all_channels=False,
+            match_type="explicit",
+            **scanned,
+        )
     else:
         classification = classify_query(query)
-
-    pipeline_result["steps"]["classify"] = classification
-    print(f"  Channels: {classification['channels'] or '(auto-detect from available data)'}")
-    print(f"  Groups: {classification.get('groups', [])}")
-    print(f"  Template: {classification['template']}")
-    print(f"  Comparison: {classification['comparison_type']}")
-    print(f"  Geo: {classification['geo']}")
-    print(f"  Match type: {classification['match_type']}")
-
-    if classification["match_type"] == "fallback" and not channels and not preprocess_only:
+        if period_range:
+            classification = replace(classification, date_range=period_range)
+
+    pipeline_result["steps"]["classify"] = classification.to_dict()
+    print(f"  Channels: {list(classification.channels) or '(auto-detect from available data)'}")
+    print(f"  Groups: {list(classification.groups)}")
+    print(f"  Template: {classification.template}")
+    print(f"  Comparison: {classification.comparison_type}")
+    print(f"  Geo: {classification.geo}")
+    print(f"  Match type: {classification.match_type}")
+
+    if classification.match_type == "fallback" and not channels and not preprocess_only:
         available = get_available_data()
         if available:
             print(f"\n  No keyword match. Available data sources: {list(available.keys())}")
@@ -1002,23 +1304,22 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
 
     if gate == "BLOCK":
         print("  BLOCKED: Data quality issues must be resolved before analysis.")
-        for caveat in validation_result.get("caveats", []):
-            print(f"    - {caveat}")
+        _print_lines(f"    - {caveat}" for caveat in validation_result.get("caveats", []))
         pipeline_result["status"] = "blocked_by_quality"
         return pipeline_result
 
     if gate == "PROCEED_WITH_CAVEATS":
         print("  Proceeding with caveats:")
-        for caveat in validation_result.get("caveats", []):
-            print(f"    - {caveat}")
+        _print_lines(f"    - {caveat}" for caveat in validation_result.get("caveats", []))
 
     # ── Step 4: Dispatch ──
     print("\n[4/9] DISPATCH — Routing to channel agents...")
     available_data = get_available_data()
-    if classification.get("all_channels"):
-        requested = list(available_data.keys())
+    # Iterating the dict yields its channel keys; no intermediate lists needed.
+    if classification.all_channels or not classification.channels:
+        requested = available_data
     else:
-        requested = classification["channels"] or list(available_data.keys())
+        requested = classification.channels
     active_channels, skipped = filter_channels_by_data(requested, available_data)
 
     if skipped:
@@ -1029,27 +1330,30 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
         return pipeline_result
 
     print(f"  Active channels: {active_channels}")
-    active_groups = list(set(CHANNEL_GROUPS.get(ch, "") for ch in active_channels if ch in CHANNEL_GROUPS))
-    active_groups = [g for g in active_groups if g]
+    active_groups = list(_groups_for(active_channels))
     print(f"  Active groups: {active_groups}")
     print(f"  Mode: {'parallel' if len(active_channels) > 1 else 'sequential'}")
+    channel_prompt_paths = {ch: DATA_PIPELINE / f"{ch}_prompt.md" for ch in active_channels}
 
     # Build contexts and prompts for each channel
-    channel_contexts = {}
-    for ch in active_channels:
-        ctx = build_agent_context(ch, classification)
-        channel_contexts[ch] = ctx
-        prompt = build_subagent_prompt(ch, ctx)
-        prompt_file = DATA_PIPELINE / f"{ch}_prompt.md"
-        with open(prompt_file, "w") as f:
-            f.write(prompt)
-        print(f"  Wrote sub-agent prompt: {prompt_file.name}")
+    from concurrent.futures import ThreadPoolExecutor
+
+    def write_channel_prompt(ch):
+        ctx = build_agent_context(ch, classification, available_data)
+        write_prompt(channel_prompt_paths[ch], build_subagent_prompt(ch, ctx))
+        return ctx
+
+    # Channels are independent, so build and write their prompts concurrently;
+    # map() keeps results (and the log below) in channel order
+    with ThreadPoolExecutor(max_workers=min(8, len(active_channels))) as pool:
+        channel_contexts = dict(zip(active_channels, pool.map(write_channel_prompt, active_channels)))
+    _print_lines(f"  {wrote} sub-agent prompt: {path.name}" for path in channel_prompt_paths.values())
 
     pipeline_result["steps"]["dispatch"] = {
         "active_channels": active_channels,
         "active_groups": active_groups,
         "skipped_channels": skipped,
-        "prompts_written": [f"{ch}_prompt.md" for ch in active_channels],
+        "prompts_written": [path.name for path in channel_prompt_paths.values()],
     }
 
     # ── Step 5: Group Synthesis ──
@@ -1060,9 +1364,8 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
         for group in group_synthesis_groups:
             group_prompt = build_group_synthesis_prompt(group, [])  # Placeholder
             grp_file = DATA_PIPELINE / f"{group}_group_synthesis_prompt.md"
-            with open(grp_file, "w") as f:
-                f.write(group_prompt)
-            print(f"  Wrote group synthesis prompt: {grp_file.name}")
+            write_prompt(grp_file, group_prompt)
+            print(f"  {wrote} group synthesis prompt: {grp_file.name}")
         pipeline_result["steps"]["group_synthesis"] = {
             "groups": group_synthesis_groups,
             "prompts_written": [f"{g}_group_synthesis_prompt.md" for g in group_synthesis_groups],
@@ -1075,9 +1378,8 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
     print("\n[6/9] HYPOTHESIZE — Preparing hypothesis agent...")
     hypothesis_prompt = build_hypothesis_prompt([])  # Placeholder; real data comes from step 4 outputs
     hyp_file = DATA_PIPELINE / "hypothesis_prompt.md"
-    with open(hyp_file, "w") as f:
-        f.write(hypothesis_prompt)
-    print(f"  Wrote hypothesis prompt: {hyp_file.name}")
+    write_prompt(hyp_file, hypothesis_prompt)
+    print(f"  {wrote} hypothesis prompt: {hyp_file.name}")
     pipeline_result["steps"]["hypothesis"] = {"prompt_written": str(hyp_file)}
 
     # ── Step 7: Top-level synthesis prompt (conditional) ──
@@ -1085,9 +1387,8 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
         print(f"\n[7/9] TOP SYNTHESIZE — Preparing top-level synthesis (multi-group)...")
         top_synthesis_prompt = build_top_synthesis_prompt([], {})  # Placeholder
         syn_file = DATA_PIPELINE / "top_synthesis_prompt.md"
-        with open(syn_file, "w") as f:
-            f.write(top_synthesis_prompt)
-        print(f"  Wrote top synthesis prompt: {syn_file.name}")
+        write_prompt(syn_file, top_synthesis_prompt)
+        print(f"  {wrote} top synthesis prompt: {syn_file.name}")
         pipeline_result["steps"]["top_synthesis"] = {"prompt_written": str(syn_file)}
     else:
         print(f"\n[7/9] TOP SYNTHESIZE — Skipped ({'single group' if len(active_groups) <= 1 else 'single channel'})")
@@ -1095,7 +1396,7 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
 
     # ── Step 8: Template ──
     print("\n[8/9] FORMAT — Template selection...")
-    template = classification["template"]
+    template = classification.template
     pipeline_result["steps"]["format"] = {
         "template": template,
         "output_dir": str(DATA_PIPELINE),
@@ -1108,16 +1409,21 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
 
     # Save full pipeline result
     result_file = DATA_PIPELINE / "pipeline_result.json"
-    with open(result_file, "w") as f:
-        json.dump(pipeline_result, f, indent=2, default=str)
+    if not dry_run:
+        write_atomic(result_file, dump_json(pipeline_result))
 
     print(f"\n{'='*60}")
     print(f"Pipeline Status: {pipeline_result['status'].upper()}")
     print(f"{'='*60}")
-    print(f"\nSub-agent prompts written to: {DATA_PIPELINE}/")
-    print(f"Pipeline result saved to: {result_file}")
+    if dry_run:
+        print(f"\n[DRY RUN] Prompts and pipeline result not written to: {DATA_PIPELINE}/")
+    else:
+        print(f"\nSub-agent prompts written to: {DATA_PIPELINE}/")
+        print(f"Pipeline result saved to: {result_file}")
 
-    if pipeline_result["status"] == "ready":
+    if dry_run:
+        print("\n[DRY RUN] Skipping agent execution")
+    elif pipeline_result["status"] == "ready":
         # Attempt auto-execution via orchestrator
         auto_executed = _auto_execute_agents(
             active_channels, classification, group_synthesis_groups,
@@ -1127,13 +1433,13 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
         if not auto_executed:
             print(f"\nManual execution required:")
             print(f"  1. Invoke channel sub-agents (can run in parallel):")
-            for ch in active_channels:
-                print(f"     - {ch}: read {DATA_PIPELINE / f'{ch}_prompt.md'} and execute")
+            _print_lines(f"     - {ch}: read {path} and execute"
+                         for ch, path in channel_prompt_paths.items())
             print(f"  2. Collect outputs from {DATA_PIPELINE}/*_output.json")
             if group_synthesis_groups:
                 print(f"  3. Invoke group synthesis agents (parallel across groups):")
-                for g in group_synthesis_groups:
-                    print(f"     - {g}: read {DATA_PIPELINE / f'{g}_group_synthesis_prompt.md'}")
+                _print_lines(f"     - {g}: read {DATA_PIPELINE / f'{g}_group_synthesis_prompt.md'}"
+                             for g in group_synthesis_groups)
             print(f"  4. Invoke hypothesis sub-agent with all outputs")
             if needs_top_synthesis:
                 print(f"  5. Invoke top-level synthesis with group outputs")
@@ -1142,7 +1448,35 @@ def run_pipeline(query: str = "", channels: list[str] | None = None,
     return pipeline_result
 
 
-def main():
+# Every channel name a user may pass via --channels
+_KNOWN_CHANNELS = frozenset(CHANNEL_GROUPS).union(
+    ch for route in ROUTING_TABLE for ch in route["channels"]
+)
+
+
+def _parse_channels(raw: str) -> tuple[str, ...]:
+    """Split a --channels value into known, de-duplicated channel names.
+
+    Order is preserved so dispatch and prompt output stay deterministic.
+    Raises ValueError listing any unknown names.
+    """
+    channels = tuple(dict.fromkeys(sys.intern(c.strip().lower()) for c in raw.split(",") if c.strip()))
+    unknown = [c for c in channels if c not in _KNOWN_CHANNELS]
+    if unknown:
+        raise ValueError(f"unknown channels: {', '.join(unknown)} "
+                         f"(known: {', '.join(sorted(_KNOWN_CHANNELS))})")
+    return channels
+
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the CLI parser once per process.
+
+    argparse is imported here so library use skips it; repeated
+    in-process main() calls reuse the same parser.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Marketing Analytics Orchestrator — Run the full analysis pipeline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1164,19 +1498,38 @@ Examples:
     parser.add_argument("--preprocess-only", action="store_true", help="Only run preprocessing and validation")
     parser.add_argument("--dry-run", action="store_true", help="Don't write any files")
     parser.add_argument("--json", action="store_true", help="Output pipeline result as JSON")
+    return parser
+
+
+def _validate(args) -> str | None:
+    """Check every CLI input before the pipeline runs.
+
+    Normalizes args.channels to a tuple and args.period to (start, end)
+    dates in place. Returns the first error message, or None.
+    """
+    if args.skip_preprocess and args.preprocess_only:
+        return "--skip-preprocess and --preprocess-only are mutually exclusive"
+    try:
+        args.channels = _parse_channels(args.channels) if args.channels else None
+        args.period = parse_period(args.period) if args.period else None
+    except ValueError as e:
+        return str(e)
+    if not args.query and not args.channels and not args.preprocess_only:
+        return "provide a query or --channels or --preprocess-only"
+    return None
 
-    args = parser.parse_args()
 
-    channels = args.channels.split(",") if args.channels else None
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
 
-    if not args.query and not channels and not args.preprocess_only:
-        parser.print_help()
-        print("\nError: Provide a query or --channels or --preprocess-only")
-        sys.exit(1)
+    error = _validate(args)
+    if error:
+        parser.error(error)
 
     result = run_pipeline(
         query=args.query,
-        channels=channels,
+        channels=args.channels,
         period=args.period,
         skip_preprocess=args.skip_preprocess,
         preprocess_only=args.preprocess_only,
@@ -1184,10 +1537,14 @@ Examples:
     )
 
     if args.json:
-        print(json.dumps(result, indent=2, default=str))
+        write_json_stdout(result)
 
-    sys.exit(0 if result["status"] in ("ready", "preprocess_only") else 1)
+    return 0 if result["status"] in ("ready", "preprocess_only") else 1
 
 
 if __name__ == "__main__":
-    main()
+    code = main()
+    # Everything is written by now; skip interpreter teardown (atexit, GC)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
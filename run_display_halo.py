@@ -7,8 +7,9 @@ One-command execution: validate inputs, archive old report, generate new report,
 import os
 import sys
 import shutil
+import stat
 import subprocess
-from datetime import datetime
+import time
 
 # ── Paths ──────────────────────────────────────────────────────────────
 ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +23,15 @@ DATA_FILE = os.path.join(INPUT_DIR, "HALO - data - Data per MKG channel.csv")
 MIN_REPORT_KB = 10
 
 
+def _stat_file(path):
+    """Return os.stat for path if it is a regular file, else None (one syscall)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None  # missing, unreadable or a broken path, as os.path.isfile treated it
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
 def validate():
     print("=" * 60)
     print("STEP 1: Validate inputs")
@@ -31,8 +41,9 @@ def validate():
         ("Halo data", DATA_FILE),
         ("Report generator", GENERATOR),
     ]:
-        if os.path.isfile(path):
-            size_kb = os.path.getsize(path) / 1024
+        st = _stat_file(path)
+        if st is not None:
+            size_kb = st.st_size / 1024
             print(f"  OK  {label}: {os.path.basename(path)} ({size_kb:.0f} KB)")
         else:
             print(f"  FAIL  {label}: NOT FOUND at {path}")
@@ -51,7 +62,7 @@ def archive():
         print("  No existing report to archive.\n")
         return
     os.makedirs(ARCHIVE_DIR, exist_ok=True)
-    ts = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    ts = time.strftime("%Y-%m-%d_%H%M%S")
     dest = os.path.join(ARCHIVE_DIR, f"display-halo-report_{ts}.html")
     shutil.copy2(REPORT, dest)
     size_kb = os.path.getsize(dest) / 1024
@@ -62,19 +73,18 @@ def generate():
     print("=" * 60)
     print("STEP 3: Generate new report")
     print("=" * 60)
-    result = subprocess.run(
+    # Stream generator output (stderr merged) as it is produced
+    with subprocess.Popen(
         [sys.executable, GENERATOR],
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
-    )
-    if result.stdout:
-        for line in result.stdout.strip().split("\n"):
-            print(f"  {line}")
-    if result.returncode != 0:
-        print(f"\n  ERROR: Generator exited with code {result.returncode}")
-        if result.stderr:
-            for line in result.stderr.strip().split("\n"):
-                print(f"  {line}")
+        bufsize=1,
+    ) as proc:
+        for line in proc.stdout:
+            print(f"  {line.rstrip()}", flush=True)
+    if proc.returncode != 0:
+        print(f"\n  ERROR: Generator exited with code {proc.returncode}")
         sys.exit(1)
     print()
 
@@ -83,19 +93,23 @@ def verify():
     print("=" * 60)
     print("STEP 4: Verify output")
     print("=" * 60)
-    if not os.path.isfile(REPORT):
+    st = _stat_file(REPORT)
+    if st is None:
         print(f"  FAIL: Report not found at {REPORT}")
         sys.exit(1)
-    size_kb = os.path.getsize(REPORT) / 1024
+    size_kb = st.st_size / 1024
     if size_kb < MIN_REPORT_KB:
         print(f"  FAIL: Report too small ({size_kb:.0f} KB < {MIN_REPORT_KB} KB minimum)")
         sys.exit(1)
     print(f"  OK  Report: {REPORT}")
     print(f"  OK  Size: {size_kb:.0f} KB")
 
-    archive_count = 0
-    if os.path.isdir(ARCHIVE_DIR):
-        archive_count = len([f for f in os.listdir(ARCHIVE_DIR) if f.startswith("display-halo")])
+    # One scandir pass; a missing archive dir just means no archives yet
+    try:
+        with os.scandir(ARCHIVE_DIR) as entries:
+            archive_count = sum(1 for e in entries if e.name.startswith("display-halo") and e.is_file())
+    except FileNotFoundError:
+        archive_count = 0
     print(f"  Archive: {archive_count} previous report(s)\n")
 
 
@@ -0,0 +1,64 @@
+"""
+JSON and file-writing helpers shared by run_analysis.py, preprocess.py and validate_data.py.
+
+Uses orjson when installed and the stdlib json module otherwise; output is
+2-space indented either way. Not meant to be run directly.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _json_default(obj):
+    """Fallback for values the encoder does not handle: numpy scalars as Python numbers, anything else as str."""
+    if np is not None and isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def dump_json(obj) -> bytes:
+    """Serialize to 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=_json_default)
+    return json.dumps(obj, indent=2, default=_json_default).encode()
+
+
+def load_json(data: bytes | str):
+    """Parse JSON; errors are json.JSONDecodeError (a ValueError) with either parser."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json_stdout(obj) -> None:
+    """Write obj to stdout as indented JSON without building an intermediate str."""
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    if orjson is not None:
+        sys.stdout.buffer.write(dump_json(obj) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, indent=2, default=_json_default)
+        sys.stdout.write("\n")
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path so readers never see a partial file.
+
+    Writes a temp file named after this process, then renames it over path,
+    so concurrent writers (worker processes, parallel runs) cannot interleave.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
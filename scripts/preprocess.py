@@ -17,11 +17,12 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 
 import pandas as pd
@@ -31,6 +32,14 @@ try:
 except ImportError:
     yaml = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+from json_io import write_json_stdout
+
 # Resolve paths relative to project root
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -38,6 +47,9 @@ DATA_INPUT = PROJECT_ROOT / "data" / "input"
 DATA_VALIDATED = PROJECT_ROOT / "data" / "validated"
 SCHEMAS_DIR = PROJECT_ROOT / "data" / "schemas"
 
+# Upper bound on input files processed concurrently (one process each)
+MAX_PREPROCESS_WORKERS = 8
+
 # Column name aliases: common variations -> standard name
 COLUMN_ALIASES = {
     # Google Ads
@@ -57,7 +69,6 @@ COLUMN_ALIASES = {
     "url": "Page",
     # Affiliate
     "sales": "Conversions",
-    "orders": "Conversions",
     "commissions": "Commission",
     "pub": "Publisher",
     "publisher name": "Publisher",
@@ -112,7 +123,6 @@ COLUMN_ALIASES = {
     "partner name": "Partner",
     "network": "Partner",
     "transactions": "Transactions",
-    "orders": "Transactions",
     "net revenue": "Net Revenue",
     "incentive cost": "Incentive Cost",
     "incentive": "Incentive Cost",
@@ -147,6 +157,22 @@ COLUMN_ALIASES = {
     "promo spend": "Promo Spend",
 }
 
+# Aliases whose standard name depends on the source, layered over COLUMN_ALIASES
+SOURCE_COLUMN_ALIASES = {
+    "affiliate": {"orders": "Conversions"},
+    "distribution": {"orders": "Transactions"},
+    "promo": {"orders": "Orders"},
+}
+# While the source is unknown, "orders" maps to Transactions so distribution
+# files can still be identified from their standardized columns
+_DEFAULT_SOURCE_ALIASES = SOURCE_COLUMN_ALIASES["distribution"]
+
+# Full alias table per source, merged once at import
+_ALIASES_BY_SOURCE = {
+    source: {**COLUMN_ALIASES, **aliases} for source, aliases in SOURCE_COLUMN_ALIASES.items()
+}
+_DEFAULT_ALIASES = {**COLUMN_ALIASES, **_DEFAULT_SOURCE_ALIASES}
+
 # Source identification rules: (source_name, required_columns_set)
 # Order matters: most specific (most required columns) first to avoid false matches.
 # Google Ads requires Conversions; Display does not. This is the key discriminator.
@@ -168,6 +194,12 @@ SOURCE_SIGNATURES = [
     ("display", {"Campaign", "Impressions", "Cost"}),
 ]
 
+# Lowercased copies for the case-insensitive pass, built once at import
+_SOURCE_SIGNATURES_LOWER = [
+    (source_name, frozenset(c.lower() for c in required))
+    for source_name, required in SOURCE_SIGNATURES
+]
+
 # Date format detection patterns
 DATE_FORMATS = [
     ("%Y-%m-%d", "YYYY-MM-DD"),
@@ -182,8 +214,9 @@ DATE_FORMATS = [
 ]
 
 
+@lru_cache(maxsize=1)
 def load_schemas():
-    """Load all YAML schemas from /data/schemas/."""
+    """Load all YAML schemas from /data/schemas/ (parsed once per process; treat as read-only)."""
     if yaml is None:
         return {}
     schemas = {}
@@ -208,13 +241,56 @@ def detect_file_type(filepath: Path) -> str:
         return "unknown"
 
 
+CSV_SEPARATORS = (",", "\t", ";")
+CSV_SNIFF_BYTES = 64 * 1024
+
+
+def _read_csv_arrow(filepath: Path) -> pd.DataFrame | None:
+    """Parse a CSV once with PyArrow, sniffing the separator from the header line.
+
+    Returns None when PyArrow is unavailable or cannot parse the file cleanly
+    (no separator in the header, ragged rows, non-UTF-8 bytes), so the caller
+    can fall back to the pandas separator/encoding probe.
+    """
+    if pacsv is None:
+        return None
+    with open(filepath, "rb") as f:
+        head = f.read(CSV_SNIFF_BYTES)
+    header = head.split(b"\n", 1)[0]
+    sep = next((s for s in CSV_SEPARATORS if s.encode() in header), None)
+    if sep is None:
+        return None
+    try:
+        table = pacsv.read_csv(
+            filepath,
+            parse_options=pacsv.ParseOptions(delimiter=sep),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+    except Exception:
+        return None
+    if table.num_columns <= 1:
+        return None
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date32(field.type):
+            # Only strict YYYY-MM-DD is inferred as date32, so casting back to
+            # text is lossless and matches what pandas returns
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        elif pa.types.is_temporal(field.type) or pa.types.is_binary(field.type):
+            # Reformatted timestamps/times, or bytes that are not UTF-8
+            return None
+    return table.to_pandas()
+
+
 def read_file(filepath: Path) -> pd.DataFrame | None:
     """Read a tabular file into a DataFrame."""
     file_type = detect_file_type(filepath)
 
     if file_type == "csv":
+        df = _read_csv_arrow(filepath)
+        if df is not None:
+            return df
         # Try multiple separators and encodings
-        for sep in [",", "\t", ";"]:
+        for sep in CSV_SEPARATORS:
             try:
                 df = pd.read_csv(filepath, sep=sep, encoding="utf-8")
                 if len(df.columns) > 1:
@@ -242,58 +318,69 @@ def strip_junk_rows(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     # Drop rows where all values are NaN
-    df = df.dropna(how="all").reset_index(drop=True)
-
-    # Check if first few rows look like junk headers (all strings, no numeric data)
-    rows_to_drop = []
-    for i in range(min(5, len(df))):
-        row = df.iloc[i]
-        # If a row has fewer than 2 non-null values, it's likely junk
-        non_null = row.dropna()
-        if len(non_null) <= 1:
-            rows_to_drop.append(i)
-        else:
-            break  # Stop at first non-junk row
-
-    if rows_to_drop:
-        df = df.drop(rows_to_drop).reset_index(drop=True)
+    df = df.dropna(how="all")
+
+    # Find the kept row range positionally and slice/reset the index once
+    start, end = 0, len(df)
+    non_null_counts = df.notna().sum(axis=1).to_numpy()
+
+    # Check if first few rows look like junk headers (all strings, no numeric data):
+    # if a row has fewer than 2 non-null values, it's likely junk
+    while start < min(5, end) and non_null_counts[start] <= 1:
+        start += 1
 
     # Check for summary/total rows at bottom
-    if len(df) > 1:
-        last_rows_to_check = min(3, len(df))
-        for i in range(1, last_rows_to_check + 1):
-            row = df.iloc[-i]
-            first_val = str(row.iloc[0]).lower().strip() if pd.notna(row.iloc[0]) else ""
+    if end - start > 1:
+        first_col = df.iloc[:, 0]
+        for i in range(1, min(3, end - start) + 1):
+            val = first_col.iloc[end - i]
+            first_val = str(val).lower().strip() if pd.notna(val) else ""
             if first_val in ("total", "totals", "grand total", "sum", "summary", ""):
-                df = df.iloc[:-i]
+                end -= i
                 break
 
-    return df.reset_index(drop=True)
+    return df.iloc[start:end].reset_index(drop=True)
+
+
+def _head_notna(series: pd.Series, n: int) -> pd.Series:
+    """Same as series.dropna().head(n), scanning only the top rows when they hold n values."""
+    window = series.head(4 * n).dropna()
+    if len(window) >= n or len(series) <= 4 * n:
+        return window.head(n)
+    return series.dropna().head(n)
+
 
+# Sentinel for COLUMN_ALIASES lookups, where None means "drop this column"
+_NO_ALIAS = object()
 
-def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Rename columns using alias map, strip whitespace, remove currency/percent symbols."""
+# Values made only of digits and currency/percent formatting
+_NUMERIC_LIKE_RE = re.compile(r"^[\s$%,.\d+-]+$")
+# Formatting stripped before numeric conversion
+_NUMERIC_JUNK_RE = re.compile(r"[$,\s%]")
+
+
+def standardize_columns(df: pd.DataFrame, source: str | None = None) -> pd.DataFrame:
+    """Rename columns using alias map, strip whitespace, remove currency/percent symbols.
+
+    ``source`` selects source-specific aliases (see SOURCE_COLUMN_ALIASES).
+    """
     # Strip whitespace from column names
     df.columns = [col.strip() for col in df.columns]
 
-    # Apply aliases (case-insensitive)
+    # Apply aliases (case-insensitive); one probe per column, plus a second
+    # without trailing periods only when the exact name is not an alias
     new_columns = {}
     drop_columns = []
+    get_alias = _ALIASES_BY_SOURCE.get(source, _DEFAULT_ALIASES).get
     for col in df.columns:
-        col_lower = col.lower().strip()
-        if col_lower in COLUMN_ALIASES:
-            alias = COLUMN_ALIASES[col_lower]
-            if alias is None:
-                drop_columns.append(col)
-            else:
-                new_columns[col] = alias
-        # Also check without trailing periods
-        elif col_lower.rstrip(".") in COLUMN_ALIASES:
-            alias = COLUMN_ALIASES[col_lower.rstrip(".")]
-            if alias is None:
-                drop_columns.append(col)
-            else:
-                new_columns[col] = alias
+        col_lower = col.lower()
+        alias = get_alias(col_lower, _NO_ALIAS)
+        if alias is _NO_ALIAS:
+            alias = get_alias(col_lower.rstrip("."), _NO_ALIAS)
+        if alias is None:
+            drop_columns.append(col)
+        elif alias is not _NO_ALIAS:
+            new_columns[col] = alias
 
     if drop_columns:
         df = df.drop(columns=drop_columns, errors="ignore")
@@ -304,21 +391,20 @@ def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
     # Clean numeric columns: remove $, commas, % signs
     for col in df.columns:
         if df[col].dtype == object:
-            sample = df[col].dropna().head(20)
+            sample = _head_notna(df[col], 20)
             if len(sample) == 0:
                 continue
 
             # Check if values look numeric with currency/percent formatting
-            numeric_pattern = re.compile(r"^[\s$%,.\d+-]+$")
-            looks_numeric = sample.apply(lambda x: bool(numeric_pattern.match(str(x)))).mean() > 0.7
+            # (20 values at most, so a plain loop beats .apply and .str.match)
+            looks_numeric = sum(1 for x in sample if _NUMERIC_LIKE_RE.match(str(x))) / len(sample) > 0.7
 
             if looks_numeric:
-                # Strip currency symbols, commas, percent signs, spaces
-                cleaned = df[col].astype(str).str.replace(r"[$,\s]", "", regex=True)
-
+                raw = df[col].astype(str)
                 # Handle percent: convert to decimal
-                has_percent = df[col].astype(str).str.contains("%").any()
-                cleaned = cleaned.str.replace("%", "", regex=False)
+                has_percent = raw.str.contains("%", regex=False).any()
+                # Strip currency symbols, commas, percent signs, spaces in one pass
+                cleaned = raw.str.replace(_NUMERIC_JUNK_RE, "", regex=True)
 
                 df[col] = pd.to_numeric(cleaned, errors="coerce")
 
@@ -332,19 +418,24 @@ def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 def detect_date_format(series: pd.Series) -> str | None:
     """Detect the date format of a string series."""
-    sample = series.dropna().head(20).astype(str)
-    if len(sample) == 0:
+    sample = [str(val).strip() for val in _head_notna(series, 20)]
+    n = len(sample)
+    if n == 0:
         return None
 
+    strptime = datetime.strptime
     for fmt, label in DATE_FORMATS:
-        matches = 0
+        matches = misses = 0
         for val in sample:
             try:
-                datetime.strptime(val.strip(), fmt)
+                strptime(val, fmt)
                 matches += 1
             except ValueError:
-                pass
-        if matches / len(sample) >= 0.8:
+                misses += 1
+                # Stop once this format can no longer reach the 80% threshold
+                if (n - misses) / n < 0.8:
+                    break
+        if matches / n >= 0.8:
             return fmt
 
     return None
@@ -383,7 +474,7 @@ def standardize_dates(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
 
     # Check for ambiguous dates (DD/MM vs MM/DD)
     if fmt in ("%m/%d/%Y", "%d/%m/%Y", "%m/%d/%y", "%d/%m/%y"):
-        sample = df["Date"].dropna().head(50).astype(str)
+        sample = _head_notna(df["Date"], 50).astype(str)
         day_parts = []
         month_parts = []
         for val in sample:
@@ -425,23 +516,40 @@ def identify_source(df: pd.DataFrame) -> str | None:
             return source_name
 
     # Fuzzy match: try case-insensitive
-    cols_lower = {c.lower() for c in df.columns}
-    for source_name, required in SOURCE_SIGNATURES:
-        required_lower = {c.lower() for c in required}
+    cols_lower = {c.lower() for c in cols}
+    for source_name, required_lower in _SOURCE_SIGNATURES_LOWER:
         if required_lower.issubset(cols_lower):
             return source_name
 
     return None
 
 
+# Campaign-name geo markers; detect_geo also accepts spelled-out region names
+_NA_CAMPAIGN_RE = re.compile(r"\bNA\b|North America|_NA_|_na_", re.IGNORECASE)
+_INTL_CAMPAIGN_RE = re.compile(r"\bINTL\b|International|_INTL_|_intl_", re.IGNORECASE)
+_NA_SPLIT_RE = re.compile(r"\bNA\b|_NA_|_na_", re.IGNORECASE)
+_INTL_SPLIT_RE = re.compile(r"\bINTL\b|_INTL_|_intl_", re.IGNORECASE)
+
+
+def _campaign_mask(campaigns: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """Boolean mask of rows whose campaign name matches pattern.
+
+    Exports repeat each campaign once per day, so the regex runs over the
+    distinct names only and the result is broadcast back with isin().
+    """
+    matched = [name for name in campaigns.dropna().unique()
+               if isinstance(name, str) and pattern.search(name)]
+    return campaigns.isin(matched)
+
+
 def detect_geo(df: pd.DataFrame, source: str) -> str:
     """Detect geography from data. Returns 'na', 'intl', or 'all'."""
     if source in ("google-ads", "display"):
         # Check Campaign names for geo indicators
         if "Campaign" in df.columns:
-            campaigns = df["Campaign"].dropna().astype(str)
-            has_na = campaigns.str.contains(r"\bNA\b|North America|_NA_|_na_", case=False, regex=True).any()
-            has_intl = campaigns.str.contains(r"\bINTL\b|International|_INTL_|_intl_", case=False, regex=True).any()
+            names = df["Campaign"].dropna().astype(str).unique()
+            has_na = any(_NA_CAMPAIGN_RE.search(name) for name in names)
+            has_intl = any(_INTL_CAMPAIGN_RE.search(name) for name in names)
             if has_na and has_intl:
                 return "all"
             elif has_na:
@@ -463,11 +571,21 @@ def detect_geo(df: pd.DataFrame, source: str) -> str:
     return "all"
 
 
+_ISO_DATE_RE = re.compile(r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])")
+
+
 def get_date_range(df: pd.DataFrame) -> tuple[str, str] | None:
     """Extract min and max dates from the Date column."""
     if "Date" not in df.columns:
         return None
 
+    # standardize_dates leaves YYYY-MM-DD text, which sorts chronologically,
+    # so min/max can be read off the strings without re-parsing them
+    values = df["Date"].dropna()
+    if (len(values) and pd.api.types.is_string_dtype(values)
+            and values.str.fullmatch(_ISO_DATE_RE).all()):
+        return values.min(), values.max()
+
     try:
         dates = pd.to_datetime(df["Date"], errors="coerce").dropna()
         if len(dates) == 0:
@@ -480,8 +598,8 @@ def get_date_range(df: pd.DataFrame) -> tuple[str, str] | None:
 def split_by_geo(df: pd.DataFrame, source: str) -> dict[str, pd.DataFrame]:
     """Split DataFrame into NA and INTL subsets if both are present."""
     if source in ("google-ads", "display") and "Campaign" in df.columns:
-        na_mask = df["Campaign"].str.contains(r"\bNA\b|_NA_|_na_", case=False, regex=True, na=False)
-        intl_mask = df["Campaign"].str.contains(r"\bINTL\b|_INTL_|_intl_", case=False, regex=True, na=False)
+        na_mask = _campaign_mask(df["Campaign"], _NA_SPLIT_RE)
+        intl_mask = _campaign_mask(df["Campaign"], _INTL_SPLIT_RE)
 
         if na_mask.any() and intl_mask.any():
             result = {}
@@ -511,6 +629,34 @@ def split_by_geo(df: pd.DataFrame, source: str) -> dict[str, pd.DataFrame]:
     return {}
 
 
+# Characters that force CSV quoting
+_CSV_SPECIAL_RE = re.compile(r'[,"\r\n]')
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write df to path as CSV (no index), using PyArrow's native writer when possible.
+
+    Arrow can only write unquoted values, so frames with a delimiter, quote
+    or newline in any value or column name (or dtypes Arrow cannot convert)
+    fall back to pandas' to_csv, which quotes as needed. So do frames with
+    boolean columns, which Arrow would write as true/false instead of
+    pandas' True/False.
+    """
+    if pacsv is not None and not any(_CSV_SPECIAL_RE.search(str(c)) for c in df.columns):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if any(pa.types.is_boolean(t) for t in table.schema.types):
+                raise pa.ArrowNotImplementedError("bool columns are written by pandas")
+            with open(path, "wb") as f:
+                f.write((",".join(map(str, df.columns)) + "\n").encode())
+                pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(
+                    include_header=False, quoting_style="none"))
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass
+    df.to_csv(path, index=False)
+
+
 def generate_filename(source: str, geo: str, date_range: tuple[str, str] | None) -> str:
     """Generate standard filename: {source}_{geo}_{start}_to_{end}.csv."""
     if date_range:
@@ -558,11 +704,25 @@ def parse_space_number(val):
         return float("nan")
 
 
-def split_halo_file(filepath: Path, dry_run: bool = False) -> dict:
+def parse_space_numbers(col: pd.Series) -> pd.Series:
+    """Vectorized parse_space_number over a whole column, returning float64."""
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        return col.astype(float)
+    text = col.astype(str).str.strip().str.replace(" ", "", regex=False)
+    text = text.mask(text.isin(["", "#########"]))
+    try:
+        return text.astype(float)
+    except ValueError:
+        # Some cell is not a number at all; parse per value so it becomes NaN
+        return col.map(parse_space_number).astype(float)
+
+
+def split_halo_file(filepath: Path, dry_run: bool = False, df: pd.DataFrame | None = None) -> dict:
     """Split a HALO multi-channel CSV into per-channel files.
 
     The HALO CSV has one row per channel per date. This function:
-    1. Reads with space-separated number parsing
+    1. Reads with space-separated number parsing (or takes ``df`` when the
+       caller already read the file, which is then modified in place)
     2. Filters out Total/N/A rows
     3. Maps channel names to system channel IDs
     4. Writes per-channel CSV files to data/validated/
@@ -576,19 +736,20 @@ def split_halo_file(filepath: Path, dry_run: bool = False) -> dict:
         "error": None,
     }
 
-    try:
-        df = pd.read_csv(filepath)
-    except Exception as e:
-        result["status"] = "error"
-        result["error"] = f"Could not read HALO file: {e}"
-        return result
+    if df is None:
+        try:
+            df = pd.read_csv(filepath)
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = f"Could not read HALO file: {e}"
+            return result
 
     result["actions"].append(f"Read {len(df)} rows, {len(df.columns)} columns")
 
     # Parse space-separated numbers for all numeric columns
     numeric_cols = [c for c in df.columns if c not in ("Dimension 1", "Dimension 2")]
     for col in numeric_cols:
-        df[col] = df[col].apply(parse_space_number)
+        df[col] = parse_space_numbers(df[col])
 
     # Filter out Total, N/A, and NaN rows
     skip_channels = {"Total", "N/A"}
@@ -603,7 +764,9 @@ def split_halo_file(filepath: Path, dry_run: bool = False) -> dict:
     result["actions"].append(f"Found {len(channels)} channels")
 
     files_written = 0
-    for channel_raw in sorted(df["Dimension 1"].unique()):
+    # One hashed pass over Dimension 1 instead of a full scan per channel;
+    # sort=True keeps the sorted channel order of the outputs
+    for channel_raw, channel_df in df.groupby("Dimension 1", sort=True):
         channel_lower = channel_raw.lower().strip()
         channel_id = HALO_CHANNEL_MAP.get(channel_lower)
 
@@ -611,8 +774,6 @@ def split_halo_file(filepath: Path, dry_run: bool = False) -> dict:
             result["warnings"].append(f"WARN: Unknown HALO channel '{channel_raw}' — skipped")
             continue
 
-        channel_df = df[df["Dimension 1"] == channel_raw].copy()
-
         # Rename Dimension 2 -> Date
         channel_df = channel_df.rename(columns={"Dimension 2": "Date"})
         # Drop Dimension 1 (channel name is now encoded in filename)
@@ -630,7 +791,7 @@ def split_halo_file(filepath: Path, dry_run: bool = False) -> dict:
         output_path = DATA_VALIDATED / filename
 
         if not dry_run:
-            channel_df.to_csv(output_path, index=False)
+            write_csv(channel_df, output_path)
 
         result["output_files"].append(str(output_path))
         files_written += 1
@@ -679,7 +840,8 @@ def process_file(filepath: Path, dry_run: bool = False) -> dict:
 
     result["actions"].append(f"Read {len(df)} rows, {len(df.columns)} columns")
 
-    # 3. Strip junk rows
+    # 3. Strip junk rows (keeping the frame as read for the HALO splitter)
+    raw_df = df
     original_len = len(df)
     df = strip_junk_rows(df)
     if len(df) < original_len:
@@ -688,13 +850,19 @@ def process_file(filepath: Path, dry_run: bool = False) -> dict:
     # 4. Identify source from original columns (before aliasing may rename them)
     source = identify_source(df)
 
-    # 4b. Standardize columns
-    df = standardize_columns(df)
-    result["actions"].append("Standardized column names and cleaned numeric values")
-
-    # 4c. If source wasn't found from original columns, try again after standardization
+    # 4b. If source wasn't found from original columns, try again on the
+    # standardized column names (header-only frame, so no data is touched)
     if source is None:
-        source = identify_source(df)
+        source = identify_source(standardize_columns(df.head(0)))
+
+    # 4c. HALO files need special handling — split into per-channel files,
+    # reusing the frame already read instead of parsing the file again
+    if source == "halo":
+        return split_halo_file(filepath, dry_run=dry_run, df=raw_df)
+
+    # 4d. Standardize columns with the identified source's aliases
+    df = standardize_columns(df, source)
+    result["actions"].append("Standardized column names and cleaned numeric values")
 
     if source is None:
         result["status"] = "error"
@@ -703,10 +871,6 @@ def process_file(filepath: Path, dry_run: bool = False) -> dict:
 
     result["actions"].append(f"Identified source: {source}")
 
-    # 4d. HALO files need special handling — split into per-channel files
-    if source == "halo":
-        return split_halo_file(filepath, dry_run=dry_run)
-
     # 6. Standardize dates
     df, date_warnings = standardize_dates(df)
     result["warnings"].extend(date_warnings)
@@ -730,7 +894,7 @@ def process_file(filepath: Path, dry_run: bool = False) -> dict:
             output_path = DATA_VALIDATED / filename
 
             if not dry_run:
-                geo_df.to_csv(output_path, index=False)
+                write_csv(geo_df, output_path)
 
             result["output_files"].append(str(output_path))
             result["actions"].append(f"Split geo '{geo_label}': {len(geo_df)} rows -> {filename}")
@@ -740,7 +904,7 @@ def process_file(filepath: Path, dry_run: bool = False) -> dict:
         output_path = DATA_VALIDATED / filename
 
         if not dry_run:
-            df.to_csv(output_path, index=False)
+            write_csv(df, output_path)
 
         result["output_files"].append(str(output_path))
         result["actions"].append(f"Wrote {len(df)} rows -> {filename}")
@@ -758,24 +922,60 @@ def find_new_files() -> list[Path]:
     skip_extensions = {".png", ".jpg", ".jpeg", ".pdf", ".md", ".yaml", ".yml"}
     skip_dirs = {"seo"}  # seo subdirectory has its own workflow
 
-    files = []
-    for f in DATA_INPUT.iterdir():
-        if f.is_file() and f.suffix.lower() not in skip_extensions:
-            # Skip files in subdirectories
-            if f.parent != DATA_INPUT:
-                continue
-            files.append(f)
+    def wanted(entry: os.DirEntry) -> bool:
+        return entry.is_file() and os.path.splitext(entry.name)[1].lower() not in skip_extensions
 
-    # Also check subdirectories that aren't skipped
-    for d in DATA_INPUT.iterdir():
-        if d.is_dir() and d.name not in skip_dirs:
-            for f in d.rglob("*"):
-                if f.is_file() and f.suffix.lower() not in skip_extensions:
-                    files.append(f)
+    # One scandir pass over the top level; DirEntry caches the file/dir type
+    files = []
+    pending_dirs = []
+    with os.scandir(DATA_INPUT) as entries:
+        for entry in entries:
+            if wanted(entry):
+                files.append(Path(entry.path))
+            elif entry.is_dir() and entry.name not in skip_dirs:
+                pending_dirs.append(entry.path)
+
+    # Also walk subdirectories that aren't skipped (like rglob, without
+    # descending into symlinked directories below the top level)
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append(entry.path)
+                elif wanted(entry):
+                    files.append(Path(entry.path))
 
     return sorted(files)
 
 
+def run_preprocessing(files: list[Path] | None = None, dry_run: bool = False) -> list[dict] | dict:
+    """Process files (default: all new in /data/input/) and return the results.
+
+    Returns a list of per-file result dicts, or a ``no_files`` status dict
+    when there is nothing to process. This is what ``--json`` prints.
+    """
+    DATA_VALIDATED.mkdir(parents=True, exist_ok=True)
+    if files is None:
+        files = find_new_files()
+    if not files:
+        return {"status": "no_files", "message": "No files to process."}
+    return process_files(files, dry_run=dry_run)
+
+
+def process_files(files: list[Path], dry_run: bool = False) -> list[dict]:
+    """Run process_file over files, in parallel worker processes when there are several.
+
+    Files are independent (read, clean, write their own outputs), and the
+    work is pandas-bound, so processes rather than threads. Results come
+    back in input order.
+    """
+    workers = min(MAX_PREPROCESS_WORKERS, os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        return [process_file(filepath, dry_run=dry_run) for filepath in files]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(partial(process_file, dry_run=dry_run), files))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Preprocess marketing data files")
     parser.add_argument("files", nargs="*", help="Specific files to process (default: all new in /data/input/)")
@@ -783,57 +983,47 @@ def main():
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
     args = parser.parse_args()
 
+    files = [Path(f).resolve() for f in args.files] if args.files else None
+
+    if args.json:
+        write_json_stdout(run_preprocessing(files, dry_run=args.dry_run))
+        return
+
     # Ensure output directory exists
     DATA_VALIDATED.mkdir(parents=True, exist_ok=True)
 
     # Determine files to process
-    if args.files:
-        files = [Path(f).resolve() for f in args.files]
-    else:
+    if files is None:
         files = find_new_files()
 
     if not files:
-        msg = "No files to process."
-        if args.json:
-            print(json.dumps({"status": "no_files", "message": msg}))
-        else:
-            print(msg)
+        print("No files to process.")
         return
 
-    results = []
-    for filepath in files:
-        if args.json:
-            result = process_file(filepath, dry_run=args.dry_run)
-            results.append(result)
-        else:
-            print(f"\n{'='*60}")
-            print(f"Processing: {filepath.name}")
-            print(f"{'='*60}")
-
-            result = process_file(filepath, dry_run=args.dry_run)
-            results.append(result)
-
-            for action in result["actions"]:
-                print(f"  {action}")
-            for warning in result["warnings"]:
-                print(f"  {warning}")
-            if result["error"]:
-                print(f"  ERROR: {result['error']}")
-            if result["output_files"]:
-                for of in result["output_files"]:
-                    prefix = "[DRY RUN] Would write" if args.dry_run else "Wrote"
-                    print(f"  {prefix}: {Path(of).name}")
-            print(f"  Status: {result['status'].upper()}")
-
-    if args.json:
-        print(json.dumps(results, indent=2))
-    else:
-        # Summary
-        success = sum(1 for r in results if r["status"] == "success")
-        errors = sum(1 for r in results if r["status"] == "error")
-        skipped = sum(1 for r in results if r["status"] == "skipped")
+    results = process_files(files, dry_run=args.dry_run)
+    for filepath, result in zip(files, results):
         print(f"\n{'='*60}")
-        print(f"Summary: {success} success, {errors} errors, {skipped} skipped")
+        print(f"Processing: {filepath.name}")
+        print(f"{'='*60}")
+
+        for action in result["actions"]:
+            print(f"  {action}")
+        for warning in result["warnings"]:
+            print(f"  {warning}")
+        if result["error"]:
+            print(f"  ERROR: {result['error']}")
+        if result["output_files"]:
+            for of in result["output_files"]:
+                prefix = "[DRY RUN] Would write" if args.dry_run else "Wrote"
+                print(f"  {prefix}: {Path(of).name}")
+        print(f"  Status: {result['status'].upper()}")
+
+    # Summary
+    success = sum(1 for r in results if r["status"] == "success")
+    errors = sum(1 for r in results if r["status"] == "error")
+    skipped = sum(1 for r in results if r["status"] == "skipped")
+    print(f"\n{'='*60}")
+    print(f"Summary: {success} success, {errors} errors, {skipped} skipped")
 
 
 if __name__ == "__main__":
@@ -17,22 +17,43 @@ Usage:
     python scripts/validate_data.py                           # validate all files in /data/validated/
     python scripts/validate_data.py path/to/file.csv          # validate specific file
     python scripts/validate_data.py --json                    # output as JSON for orchestrator
+    python scripts/validate_data.py --jobs 4                  # cap parallel worker processes
+    python scripts/validate_data.py --no-cache                # re-validate unchanged files too
 """
 
 import argparse
+import csv
+import hashlib
 import json
 import os
+import pickle
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
 try:
     import yaml
+    # libyaml-backed loader when PyYAML was built with it
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     yaml = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+from json_io import dump_json, load_json, write_atomic, write_json_stdout
+
 # Resolve paths relative to project root
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -40,6 +61,20 @@ DATA_VALIDATED = PROJECT_ROOT / "data" / "validated"
 CONFIG_DIR = PROJECT_ROOT / "config"
 SCHEMAS_DIR = PROJECT_ROOT / "data" / "schemas"
 PIPELINE_DIR = PROJECT_ROOT / "data" / "pipeline"
+# Pickled YAML parses live in a per-user cache, never in data/pipeline/ where
+# other agents write: loading a pickle can run code
+YAML_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "validate_data"
+DQ_CACHE_DIR = PIPELINE_DIR / ".dq_cache"
+
+# Bump when the checks change in a way the script's own mtime would not reveal
+DQ_CACHE_VERSION = 1
+
+# Upper bound on files validated concurrently
+MAX_VALIDATION_WORKERS = 8
+
+# Files larger than this are validated in chunks of VALIDATION_CHUNK_ROWS rows
+VALIDATION_STREAM_BYTES = 256 * 1024 * 1024
+VALIDATION_CHUNK_ROWS = 500_000
 
 # Source name -> schema file mapping
 SOURCE_SCHEMA_MAP = {
@@ -77,20 +112,100 @@ SOURCE_RULES_MAP = {
     "halo": "halo",
 }
 
+# pandas' default NA tokens, so the PyArrow reader nulls the same cells
+CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# Source -> columns whose null ratio is checked for completeness
+CRITICAL_COLUMNS = {
+    "google-ads": ["Campaign", "Impressions", "Clicks", "Cost"],
+    "gsc": ["Page", "Clicks", "Impressions"],
+    "affiliate": ["Publisher", "Clicks", "Conversions", "Revenue"],
+    "display": ["Campaign", "Impressions", "Clicks", "Cost"],
+}
+
+# Metric columns read by the sanity-check ratios
+SANITY_NUMERIC_COLUMNS = (
+    "CTR",
+    "Clicks",
+    "Impressions",
+    "Cost",
+    "Conversions",
+    "Conversion Value",
+    "Revenue",
+    "Position",
+    "Commission",
+    "Viewable Impressions",
+)
+
+
+def safe_div(num: pd.Series, den: pd.Series) -> np.ndarray:
+    """num / den on the raw arrays; NaN where den is 0 or missing."""
+    num = num.to_numpy(dtype=float, na_value=np.nan)
+    den = den.to_numpy(dtype=float, na_value=np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = num / den
+    out[den == 0] = np.nan
+    return out
+
+
+# Sanity check name -> candidate (columns, compute) pairs; the first whose
+# columns are all present in the file is used
+RATIO_SPECS = {
+    "ctr": ((("CTR",), lambda ctr: ctr), (("Clicks", "Impressions"), safe_div)),
+    "cpc": ((("Cost", "Clicks"), safe_div),),
+    "cvr": ((("Conversions", "Clicks"), safe_div),),
+    "roas": ((("Conversion Value", "Cost"), safe_div), (("Revenue", "Cost"), safe_div)),
+    "position": ((("Position",), lambda position: position),),
+    "commission_rate": ((("Commission", "Revenue"), safe_div),),
+    "epc": ((("Revenue", "Clicks"), safe_div),),
+    "cpm": ((("Cost", "Impressions"), lambda cost, impr: safe_div(cost, impr) * 1000),),
+    "viewability": ((("Viewable Impressions", "Impressions"), safe_div),),
+}
+
+
+def _load_yaml(path: Path):
+    """Parse a YAML file, reusing the pickled parse from an earlier run while
+    the file's mtime and size are unchanged."""
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    # Key by the full path so separate checkouts do not share entries
+    path_key = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+    cache_file = YAML_CACHE_DIR / f"{path.stem}-{path_key}.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        pass  # missing, stale-format or corrupt cache: reparse
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+    try:
+        YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_file, pickle.dumps((key, data), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return data
+
 
+@lru_cache(maxsize=None)
 def load_config(filename: str) -> dict:
-    """Load a YAML config file."""
+    """Load a YAML config file (parsed once per process; treat as read-only)."""
     if yaml is None:
         return {}
     path = CONFIG_DIR / filename
     if not path.exists():
         return {}
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml(path) or {}
 
 
+@lru_cache(maxsize=None)
 def load_schema(source: str) -> dict | None:
-    """Load the YAML schema for a data source."""
+    """Load the YAML schema for a data source (parsed once per process; treat as read-only)."""
     if yaml is None:
         return None
     schema_key = SOURCE_SCHEMA_MAP.get(source)
@@ -99,419 +214,531 @@ def load_schema(source: str) -> dict | None:
     path = SCHEMAS_DIR / f"{schema_key}.yaml"
     if not path.exists():
         return None
-    with open(path) as f:
-        return yaml.safe_load(f)
+    return _load_yaml(path)
+
+
+def coerce_numeric(df: pd.DataFrame, columns) -> dict[str, pd.Series]:
+    """Coerce the given columns (those present in df) to numeric, NaN where unparseable."""
+    return {col: pd.to_numeric(df[col], errors="coerce") for col in columns if col in df.columns}
+
+
+def read_csv_header(filepath: Path) -> list[str]:
+    """Return the column names from a CSV's first non-blank line."""
+    with open(filepath, newline="", encoding="utf-8-sig", errors="replace") as f:
+        return next((row for row in csv.reader(f) if row), [])
+
+
+def read_validated_csv(filepath: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """Read a validated CSV, parsing it with PyArrow when available.
+
+    PyArrow hands back numeric columns and ISO dates already typed, so the
+    coercions in validate_file are no-ops, and parses only `columns` when
+    given. Falls back to a full pd.read_csv (which raises the error reported
+    as file_read) when PyArrow is missing or the file has ragged rows,
+    duplicate headers or non-UTF-8 bytes.
+    """
+    if pacsv is not None:
+        try:
+            table = pacsv.read_csv(
+                filepath,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=columns or [],
+                    null_values=CSV_NULL_VALUES,
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.ArrowException:
+            table = None
+        if (table is not None
+                and len(set(table.column_names)) == table.num_columns
+                and not any(pa.types.is_binary(t) for t in table.schema.types)):
+            return table.to_pandas(date_as_object=False)
+    return pd.read_csv(filepath)
+
+
+def iter_validated_csv(filepath: Path, columns: list[str] | None = None):
+    """Yield a validated CSV as DataFrames: whole via read_validated_csv, or
+    VALIDATION_CHUNK_ROWS rows at a time once the file passes
+    VALIDATION_STREAM_BYTES, so memory stays bounded on very large exports."""
+    if filepath.stat().st_size <= VALIDATION_STREAM_BYTES:
+        yield read_validated_csv(filepath, columns)
+        return
+    # PyArrow's streaming reader fixes column types from the first block, so a
+    # late non-numeric value would abort the read; pandas infers per chunk
+    with pd.read_csv(filepath, usecols=columns, chunksize=VALIDATION_CHUNK_ROWS) as reader:
+        yield from reader
+
+
+# Known source filename prefixes (longer prefixes first to avoid partial matches)
+SOURCE_PREFIXES = (
+    "referral-program",
+    "social-organic",
+    "social-paid",
+    "google-ads",
+    "mobile_app_downloads",
+    "push_notification",
+    "brand_campaign",
+    "paid_user_referral",
+    "free_referral",
+    "managed_social",
+    "promoted_social",
+    "unknown_utm",
+    "metasearch",
+    "distribution",
+    "affiliate",
+    "display",
+    "direct",
+    "email",
+    "promo",
+    "push",
+    "halo",
+    "gsc",
+    "sem",
+    "seo",
+    "sms",
+    "unknown",
+)
+# One alternation tried in SOURCE_PREFIXES order, anchored at the start
+SOURCE_PREFIX_RE = re.compile("|".join(map(re.escape, SOURCE_PREFIXES)))
+
+# Whole underscore-delimited YYYY-MM-DD parts of a filename stem
+FILENAME_DATE_RE = re.compile(r"(?<![^_])\d{4}-\d{2}-\d{2}(?![^_])")
 
 
 def detect_source_from_filename(filename: str) -> str | None:
     """Detect data source from standardized filename."""
-    name = filename.lower()
-    # Check all known source prefixes (order: longer prefixes first to avoid partial matches)
-    source_prefixes = [
-        "referral-program",
-        "social-organic",
-        "social-paid",
-        "google-ads",
-        "mobile_app_downloads",
-        "push_notification",
-        "brand_campaign",
-        "paid_user_referral",
-        "free_referral",
-        "managed_social",
-        "promoted_social",
-        "unknown_utm",
-        "metasearch",
-        "distribution",
-        "affiliate",
-        "display",
-        "direct",
-        "email",
-        "promo",
-        "push",
-        "halo",
-        "gsc",
-        "sem",
-        "seo",
-        "sms",
-        "unknown",
-    ]
-    for prefix in source_prefixes:
-        if name.startswith(prefix):
-            return prefix
-    return None
-
-
-class ValidationResult:
+    match = SOURCE_PREFIX_RE.match(filename.lower())
+    return match.group(0) if match else None
+
+
+class ValidationResult(NamedTuple):
     """A single validation check result."""
 
-    def __init__(self, check_name: str, status: str, message: str, details: dict | None = None):
-        self.check_name = check_name
-        self.status = status  # PASS, WARN, FAIL
-        self.message = message
-        self.details = details or {}
+    check_name: str
+    status: str  # PASS, WARN, FAIL
+    message: str
+    details: dict | None = None
 
     def to_dict(self) -> dict:
         return {
             "check": self.check_name,
             "status": self.status,
             "message": self.message,
-            "details": self.details,
+            "details": self.details or {},
         }
 
 
 class FileValidation:
-    """Validation results for a single file."""
+    """Validation results for a single file.
+
+    Checks are kept as parallel lists (one per field) rather than a list of
+    result objects; to_dict() zips them straight into the JSON payload.
+    """
 
     def __init__(self, filepath: Path, source: str):
         self.filepath = filepath
         self.source = source
-        self.checks: list[ValidationResult] = []
+        self.check_names: list[str] = []
+        self.statuses: list[str] = []
+        self.messages: list[str] = []
+        self.details: list[dict] = []
         self.overall_status = "PASS"
 
     def add(self, result: ValidationResult):
-        self.checks.append(result)
+        self.check_names.append(result.check_name)
+        self.statuses.append(result.status)
+        self.messages.append(result.message)
+        self.details.append(result.details or {})
         if result.status == "FAIL":
             self.overall_status = "FAIL"
         elif result.status == "WARN" and self.overall_status != "FAIL":
             self.overall_status = "WARN"
 
+    @property
+    def checks(self) -> list[ValidationResult]:
+        return [ValidationResult(*fields) for fields in zip(self.check_names, self.statuses, self.messages, self.details)]
+
     def to_dict(self) -> dict:
         return {
             "file": str(self.filepath),
             "source": self.source,
             "overall_status": self.overall_status,
-            "checks": [c.to_dict() for c in self.checks],
+            "checks": [
+                {"check": name, "status": status, "message": message, "details": details}
+                for name, status, message, details in zip(self.check_names, self.statuses, self.messages, self.details)
+            ],
         }
 
 
-def validate_schema(df: pd.DataFrame, schema: dict) -> list[ValidationResult]:
+# The check classes below accumulate state over the chunks passed to update();
+# finalize() turns it into the check's ValidationResults.
+
+
+class SchemaCheck:
     """Step 1: Validate required columns are present with correct types."""
-    results = []
 
-    if not schema or "columns" not in schema:
-        results.append(ValidationResult("schema_columns", "WARN", "No schema available for validation"))
-        return results
+    def __init__(self, schema: dict | None):
+        self.columns_spec = schema["columns"] if schema and "columns" in schema else None
+        self.df_cols: set | None = None
+        self.populated: set[str] = set()
+        self.bad_values: dict[str, int] = {}
+
+    def update(self, df: pd.DataFrame, num_cache: dict[str, pd.Series] | None = None,
+               date_cache: pd.Series | None = None):
+        """Fold one chunk in. num_cache / date_cache hold columns already coerced
+        by validate_file; anything missing from them is coerced here."""
+        if self.columns_spec is None:
+            return
+        if self.df_cols is None:
+            self.df_cols = set(df.columns)
+
+        for col_name, col_spec in self.columns_spec.items():
+            if col_name not in self.df_cols:
+                continue
+            # One non-null value settles it; later chunks skip the column
+            if col_name not in self.populated and df[col_name].notna().to_numpy().any():
+                self.populated.add(col_name)
+            if not isinstance(col_spec, dict):
+                continue
 
-    columns_spec = schema["columns"]
-    df_cols = set(df.columns)
+            col_type = col_spec.get("type", "")
+            if col_type in ("integer", "float"):
+                # Read as numbers already, so nothing can fail coercion
+                if pd.api.types.is_numeric_dtype(df[col_name]):
+                    continue
+                if num_cache is not None and col_name in num_cache:
+                    coerced = num_cache[col_name]
+                else:
+                    coerced = pd.to_numeric(df[col_name], errors="coerce")
+            elif col_type == "date":
+                if pd.api.types.is_datetime64_any_dtype(df[col_name]):
+                    continue
+                if col_name == "Date" and date_cache is not None:
+                    coerced = date_cache
+                else:
+                    coerced = pd.to_datetime(df[col_name], errors="coerce")
+            else:
+                continue
 
-    # Check required columns
-    missing_required = []
-    for col_name, col_spec in columns_spec.items():
-        if isinstance(col_spec, dict) and col_spec.get("required", False):
-            if col_name not in df_cols:
-                missing_required.append(col_name)
+            # Values present in the file that did not survive coercion; only
+            # counted once we know there are some
+            bad = coerced.isna() & df[col_name].notna()
+            if bad.any():
+                self.bad_values[col_name] = self.bad_values.get(col_name, 0) + int(bad.sum())
 
-    if missing_required:
-        results.append(ValidationResult(
-            "schema_required_columns",
-            "FAIL",
-            f"Missing required columns: {missing_required}",
-            {"missing": missing_required},
-        ))
-    else:
-        results.append(ValidationResult(
-            "schema_required_columns",
-            "PASS",
-            "All required columns present",
-        ))
+    def finalize(self) -> list[ValidationResult]:
+        results = []
+
+        if self.columns_spec is None:
+            results.append(ValidationResult("schema_columns", "WARN", "No schema available for validation"))
+            return results
 
-    # Check for fully empty critical columns
-    empty_columns = []
-    for col_name in columns_spec:
-        if col_name in df_cols:
-            if df[col_name].isna().all():
-                empty_columns.append(col_name)
-
-    if empty_columns:
-        # FAIL if required column is empty, WARN if optional
-        required_empty = [c for c in empty_columns
-                          if isinstance(columns_spec.get(c), dict)
-                          and columns_spec[c].get("required", False)]
-        optional_empty = [c for c in empty_columns if c not in required_empty]
-
-        if required_empty:
+        columns_spec = self.columns_spec
+        df_cols = self.df_cols or set()
+
+        # Check required columns
+        missing_required = []
+        for col_name, col_spec in columns_spec.items():
+            if isinstance(col_spec, dict) and col_spec.get("required", False):
+                if col_name not in df_cols:
+                    missing_required.append(col_name)
+
+        if missing_required:
             results.append(ValidationResult(
-                "schema_empty_columns",
+                "schema_required_columns",
                 "FAIL",
-                f"Required columns are completely empty: {required_empty}",
-                {"required_empty": required_empty, "optional_empty": optional_empty},
+                f"Missing required columns: {missing_required}",
+                {"missing": missing_required},
             ))
-        elif optional_empty:
+        else:
             results.append(ValidationResult(
-                "schema_empty_columns",
-                "WARN",
-                f"Optional columns are completely empty: {optional_empty}",
-                {"optional_empty": optional_empty},
+                "schema_required_columns",
+                "PASS",
+                "All required columns present",
             ))
-    else:
-        results.append(ValidationResult(
-            "schema_empty_columns",
-            "PASS",
-            "No empty columns detected",
-        ))
 
-    # Check data types
-    type_issues = []
-    for col_name, col_spec in columns_spec.items():
-        if col_name not in df_cols or not isinstance(col_spec, dict):
-            continue
+        # Check for fully empty critical columns
+        empty_columns = [c for c in columns_spec if c in df_cols and c not in self.populated]
+
+        if empty_columns:
+            # FAIL if required column is empty, WARN if optional
+            required_empty = [c for c in empty_columns
+                              if isinstance(columns_spec.get(c), dict)
+                              and columns_spec[c].get("required", False)]
+            optional_empty = [c for c in empty_columns if c not in required_empty]
+
+            if required_empty:
+                results.append(ValidationResult(
+                    "schema_empty_columns",
+                    "FAIL",
+                    f"Required columns are completely empty: {required_empty}",
+                    {"required_empty": required_empty, "optional_empty": optional_empty},
+                ))
+            elif optional_empty:
+                results.append(ValidationResult(
+                    "schema_empty_columns",
+                    "WARN",
+                    f"Optional columns are completely empty: {optional_empty}",
+                    {"optional_empty": optional_empty},
+                ))
+        else:
+            results.append(ValidationResult(
+                "schema_empty_columns",
+                "PASS",
+                "No empty columns detected",
+            ))
 
-        col_type = col_spec.get("type", "")
-
-        if col_type in ("integer", "float"):
-            non_null = df[col_name].dropna()
-            if len(non_null) > 0:
-                numeric_check = pd.to_numeric(non_null, errors="coerce")
-                non_numeric_count = numeric_check.isna().sum()
-                if non_numeric_count > 0:
-                    type_issues.append(f"{col_name}: {non_numeric_count} non-numeric values")
-
-        elif col_type == "date":
-            non_null = df[col_name].dropna()
-            if len(non_null) > 0:
-                date_check = pd.to_datetime(non_null, errors="coerce")
-                bad_dates = date_check.isna().sum()
-                if bad_dates > 0:
-                    type_issues.append(f"{col_name}: {bad_dates} unparseable dates")
-
-    if type_issues:
-        results.append(ValidationResult(
-            "schema_data_types",
-            "WARN",
-            f"Data type issues found: {len(type_issues)}",
-            {"issues": type_issues},
-        ))
-    else:
-        results.append(ValidationResult(
-            "schema_data_types",
-            "PASS",
-            "All data types valid",
-        ))
+        # Check data types
+        type_issues = []
+        for col_name in columns_spec:
+            count = self.bad_values.get(col_name)
+            if count:
+                if columns_spec[col_name]["type"] == "date":
+                    type_issues.append(f"{col_name}: {count} unparseable dates")
+                else:
+                    type_issues.append(f"{col_name}: {count} non-numeric values")
+
+        if type_issues:
+            results.append(ValidationResult(
+                "schema_data_types",
+                "WARN",
+                f"Data type issues found: {len(type_issues)}",
+                {"issues": type_issues},
+            ))
+        else:
+            results.append(ValidationResult(
+                "schema_data_types",
+                "PASS",
+                "All data types valid",
+            ))
 
-    return results
+        return results
 
 
-def validate_completeness(df: pd.DataFrame, source: str) -> list[ValidationResult]:
+class CompletenessCheck:
     """Step 2: Check date coverage, identify missing dates, flag null ratios."""
-    results = []
 
-    if "Date" not in df.columns:
-        results.append(ValidationResult(
-            "completeness_dates",
-            "WARN",
-            "No Date column — cannot check completeness",
-        ))
-        return results
+    def __init__(self, source: str):
+        self.source = source
+        self.has_date: bool | None = None
+        self.rows = 0
+        self.days: np.ndarray | None = None
+        self.nulls: dict[str, int] = {}
+
+    def update(self, df: pd.DataFrame, num_cache: dict[str, pd.Series] | None = None,
+               date_cache: pd.Series | None = None):
+        if self.has_date is None:
+            self.has_date = "Date" in df.columns
+        if not self.has_date:
+            return
+        self.rows += len(df)
+
+        if date_cache is None:
+            date_cache = pd.to_datetime(df["Date"], errors="coerce")
+        if date_cache.dt.tz is not None:
+            date_cache = date_cache.dt.tz_localize(None)
+        # Distinct calendar days (local wall time) as sorted datetime64[D]; the
+        # first/last are the date bounds. NaT sorts last and is dropped from
+        # the small unique array rather than the whole column
+        days = np.unique(date_cache.to_numpy().astype("datetime64[D]"))
+        days = days[~np.isnat(days)]
+        if len(days):
+            self.days = days if self.days is None else np.union1d(self.days, days)
+
+        # Null counts for every critical column in one reduction
+        present = [col for col in CRITICAL_COLUMNS.get(self.source, []) if col in df.columns]
+        if present:
+            for col, nulls in df[present].isna().sum().items():
+                self.nulls[col] = self.nulls.get(col, 0) + int(nulls)
+
+    def finalize(self) -> list[ValidationResult]:
+        results = []
+
+        if not self.has_date:
+            results.append(ValidationResult(
+                "completeness_dates",
+                "WARN",
+                "No Date column — cannot check completeness",
+            ))
+            return results
 
-    dates = pd.to_datetime(df["Date"], errors="coerce").dropna()
-    if len(dates) == 0:
-        results.append(ValidationResult(
-            "completeness_dates",
-            "FAIL",
-            "No valid dates found in Date column",
-        ))
-        return results
+        if self.days is None:
+            results.append(ValidationResult(
+                "completeness_dates",
+                "FAIL",
+                "No valid dates found in Date column",
+            ))
+            return results
 
-    date_min = dates.min()
-    date_max = dates.max()
-    unique_dates = dates.dt.date.unique()
-    expected_days = (date_max - date_min).days + 1
+        date_min = self.days[0]
+        date_max = self.days[-1]
 
-    # Check for missing dates
-    all_dates = pd.date_range(date_min, date_max, freq="D")
-    missing_dates = sorted(set(all_dates.date) - set(unique_dates))
+        # Check for missing dates: sorted C-level set difference on day values
+        all_days = np.arange(date_min, date_max + np.timedelta64(1, "D"), dtype="datetime64[D]")
+        expected_days = len(all_days)
+        missing_dates = np.setdiff1d(all_days, self.days, assume_unique=True)
 
-    if missing_dates:
-        if len(missing_dates) > expected_days * 0.3:
-            status = "FAIL"
-            msg = f"Major gaps: {len(missing_dates)} of {expected_days} days missing"
+        if len(missing_dates):
+            if len(missing_dates) > expected_days * 0.3:
+                status = "FAIL"
+                msg = f"Major gaps: {len(missing_dates)} of {expected_days} days missing"
+            else:
+                status = "WARN"
+                msg = f"{len(missing_dates)} of {expected_days} days missing"
+            results.append(ValidationResult(
+                "completeness_dates",
+                status,
+                msg,
+                {"missing_dates": missing_dates[:10].astype(str).tolist(),
+                 "total_missing": len(missing_dates),
+                 "date_range": f"{date_min} to {date_max}"},
+            ))
         else:
-            status = "WARN"
-            msg = f"{len(missing_dates)} of {expected_days} days missing"
-        results.append(ValidationResult(
-            "completeness_dates",
-            status,
-            msg,
-            {"missing_dates": [str(d) for d in missing_dates[:10]],
-             "total_missing": len(missing_dates),
-             "date_range": f"{date_min.date()} to {date_max.date()}"},
-        ))
-    else:
-        results.append(ValidationResult(
-            "completeness_dates",
-            "PASS",
-            f"All {expected_days} days present ({date_min.date()} to {date_max.date()})",
-        ))
-
-    # Check null ratios in critical columns
-    critical_cols = {
-        "google-ads": ["Campaign", "Impressions", "Clicks", "Cost"],
-        "gsc": ["Page", "Clicks", "Impressions"],
-        "affiliate": ["Publisher", "Clicks", "Conversions", "Revenue"],
-        "display": ["Campaign", "Impressions", "Clicks", "Cost"],
-    }
+            results.append(ValidationResult(
+                "completeness_dates",
+                "PASS",
+                f"All {expected_days} days present ({date_min} to {date_max})",
+            ))
 
-    cols_to_check = critical_cols.get(source, [])
-    null_issues = []
-    for col in cols_to_check:
-        if col in df.columns:
-            null_pct = df[col].isna().mean()
+        # Check null ratios in critical columns
+        null_issues = []
+        for col, nulls in self.nulls.items():
+            null_pct = nulls / self.rows
             if null_pct > 0.1:
                 null_issues.append(f"{col}: {null_pct:.1%} null")
             elif null_pct > 0:
                 null_issues.append(f"{col}: {null_pct:.1%} null (minor)")
 
-    if null_issues:
-        has_major = any("minor" not in issue for issue in null_issues)
-        results.append(ValidationResult(
-            "completeness_nulls",
-            "WARN" if has_major else "PASS",
-            f"Null values found in {len(null_issues)} columns",
-            {"null_columns": null_issues},
-        ))
-    else:
-        results.append(ValidationResult(
-            "completeness_nulls",
-            "PASS",
-            "No significant nulls in critical columns",
-        ))
+        if null_issues:
+            has_major = any("minor" not in issue for issue in null_issues)
+            results.append(ValidationResult(
+                "completeness_nulls",
+                "WARN" if has_major else "PASS",
+                f"Null values found in {len(null_issues)} columns",
+                {"null_columns": null_issues},
+            ))
+        else:
+            results.append(ValidationResult(
+                "completeness_nulls",
+                "PASS",
+                "No significant nulls in critical columns",
+            ))
 
-    return results
+        return results
 
 
-def validate_sanity(df: pd.DataFrame, source: str, rules: dict) -> list[ValidationResult]:
+class SanityCheck:
     """Step 3: Apply sanity bounds from data-quality-rules.yaml."""
-    results = []
 
-    source_key = SOURCE_RULES_MAP.get(source)
-    if not source_key or source_key not in rules:
-        results.append(ValidationResult(
-            "sanity_checks",
-            "WARN",
-            f"No sanity rules defined for source: {source}",
-        ))
-        return results
+    def __init__(self, source: str, rules: dict):
+        self.source = source
+        source_key = SOURCE_RULES_MAP.get(source)
+        if not source_key or source_key not in rules:
+            self.sanity_checks = None
+        else:
+            self.sanity_checks = rules[source_key].get("sanity_checks", {})
+        self.below: dict[str, int] = {}
+        self.above: dict[str, int] = {}
+        self.daily_spend: list[pd.Series] = []
+
+    def update(self, df: pd.DataFrame, num_cache: dict[str, pd.Series] | None = None,
+               date_cache: pd.Series | None = None):
+        if self.sanity_checks is None:
+            return
+        if num_cache is None:
+            num_cache = coerce_numeric(df, SANITY_NUMERIC_COLUMNS)
+
+        ratios = {}
+        for check_name, bounds in self.sanity_checks.items():
+            if not isinstance(bounds, dict):
+                continue
 
-    source_rules = rules[source_key]
-    sanity_checks = source_rules.get("sanity_checks", {})
+            if check_name == "daily_spend_max":
+                if "Cost" in df.columns and "Date" in df.columns:
+                    self.daily_spend.append(df.groupby("Date")["Cost"].sum())
+                continue
 
-    violations = []
+            # Map check name to the first computation whose columns are present
+            for cols, compute in RATIO_SPECS.get(check_name, ()):
+                if all(col in num_cache for col in cols):
+                    ratios[check_name] = compute(*(num_cache[col] for col in cols))
+                    break
+
+        if ratios:
+            # Compare every ratio against its bounds in one pass; NaN bounds never match
+            ratio_df = pd.DataFrame(ratios)
+            mins = pd.Series({name: self.sanity_checks[name].get("min") for name in ratios}, dtype=float)
+            maxs = pd.Series({name: self.sanity_checks[name].get("max") for name in ratios}, dtype=float)
+            below = ratio_df.lt(mins).sum()
+            above = ratio_df.gt(maxs).sum()
+            for name in ratios:
+                self.below[name] = self.below.get(name, 0) + int(below[name])
+                self.above[name] = self.above.get(name, 0) + int(above[name])
+
+    def finalize(self) -> list[ValidationResult]:
+        results = []
+
+        if self.sanity_checks is None:
+            results.append(ValidationResult(
+                "sanity_checks",
+                "WARN",
+                f"No sanity rules defined for source: {self.source}",
+            ))
+            return results
 
-    for check_name, bounds in sanity_checks.items():
-        if not isinstance(bounds, dict):
-            continue
+        violations = []
 
-        min_val = bounds.get("min")
-        max_val = bounds.get("max")
-
-        # Map check name to actual column/computation
-        if check_name == "ctr":
-            if "CTR" in df.columns:
-                col_data = pd.to_numeric(df["CTR"], errors="coerce")
-            elif "Clicks" in df.columns and "Impressions" in df.columns:
-                clicks = pd.to_numeric(df["Clicks"], errors="coerce")
-                impressions = pd.to_numeric(df["Impressions"], errors="coerce")
-                col_data = clicks / impressions.replace(0, float("nan"))
-            else:
-                continue
-        elif check_name == "cpc":
-            if "Cost" in df.columns and "Clicks" in df.columns:
-                cost = pd.to_numeric(df["Cost"], errors="coerce")
-                clicks = pd.to_numeric(df["Clicks"], errors="coerce")
-                col_data = cost / clicks.replace(0, float("nan"))
-            else:
-                continue
-        elif check_name == "cvr":
-            if "Conversions" in df.columns and "Clicks" in df.columns:
-                conv = pd.to_numeric(df["Conversions"], errors="coerce")
-                clicks = pd.to_numeric(df["Clicks"], errors="coerce")
-                col_data = conv / clicks.replace(0, float("nan"))
-            else:
-                continue
-        elif check_name == "roas":
-            if "Conversion Value" in df.columns and "Cost" in df.columns:
-                rev = pd.to_numeric(df["Conversion Value"], errors="coerce")
-                cost = pd.to_numeric(df["Cost"], errors="coerce")
-                col_data = rev / cost.replace(0, float("nan"))
-            elif "Revenue" in df.columns and "Cost" in df.columns:
-                rev = pd.to_numeric(df["Revenue"], errors="coerce")
-                cost = pd.to_numeric(df["Cost"], errors="coerce")
-                col_data = rev / cost.replace(0, float("nan"))
-            else:
-                continue
-        elif check_name == "position":
-            if "Position" in df.columns:
-                col_data = pd.to_numeric(df["Position"], errors="coerce")
-            else:
-                continue
-        elif check_name == "commission_rate":
-            if "Commission" in df.columns and "Revenue" in df.columns:
-                comm = pd.to_numeric(df["Commission"], errors="coerce")
-                rev = pd.to_numeric(df["Revenue"], errors="coerce")
-                col_data = comm / rev.replace(0, float("nan"))
-            else:
-                continue
-        elif check_name == "epc":
-            if "Revenue" in df.columns and "Clicks" in df.columns:
-                rev = pd.to_numeric(df["Revenue"], errors="coerce")
-                clicks = pd.to_numeric(df["Clicks"], errors="coerce")
-                col_data = rev / clicks.replace(0, float("nan"))
-            else:
-                continue
-        elif check_name == "cpm":
-            if "Cost" in df.columns and "Impressions" in df.columns:
-                cost = pd.to_numeric(df["Cost"], errors="coerce")
-                impr = pd.to_numeric(df["Impressions"], errors="coerce")
-                col_data = (cost / impr.replace(0, float("nan"))) * 1000
-            else:
-                continue
-        elif check_name == "viewability":
-            if "Viewable Impressions" in df.columns and "Impressions" in df.columns:
-                viewable = pd.to_numeric(df["Viewable Impressions"], errors="coerce")
-                impr = pd.to_numeric(df["Impressions"], errors="coerce")
-                col_data = viewable / impr.replace(0, float("nan"))
-            else:
-                continue
-        elif check_name == "daily_spend_max":
-            if "Cost" in df.columns and "Date" in df.columns:
-                daily_spend = df.groupby("Date")["Cost"].sum()
-                max_daily = daily_spend.max()
-                if max_daily > bounds.get("max", bounds):
-                    violations.append(f"daily_spend_max: max daily spend ${max_daily:,.0f} exceeds ${bounds:,}")
-                continue
-            else:
-                continue
+        if self.daily_spend:
+            bounds = self.sanity_checks["daily_spend_max"]
+            max_daily = pd.concat(self.daily_spend).groupby(level=0).sum().max()
+            if max_daily > bounds.get("max", bounds):
+                violations.append(f"daily_spend_max: max daily spend ${max_daily:,.0f} exceeds ${bounds:,}")
+
+        for name in self.below:
+            if self.below[name] > 0:
+                violations.append(f"{name}: {self.below[name]} values below minimum {self.sanity_checks[name]['min']}")
+            if self.above[name] > 0:
+                violations.append(f"{name}: {self.above[name]} values above maximum {self.sanity_checks[name]['max']}")
+
+        if violations:
+            results.append(ValidationResult(
+                "sanity_checks",
+                "WARN",
+                f"{len(violations)} sanity check violations",
+                {"violations": violations},
+            ))
         else:
-            continue
+            results.append(ValidationResult(
+                "sanity_checks",
+                "PASS",
+                "All sanity checks passed",
+            ))
 
-        col_data = col_data.dropna()
-        if len(col_data) == 0:
-            continue
+        return results
 
-        below_min = (col_data < min_val).sum() if min_val is not None else 0
-        above_max = (col_data > max_val).sum() if max_val is not None else 0
 
-        if below_min > 0:
-            violations.append(f"{check_name}: {below_min} values below minimum {min_val}")
-        if above_max > 0:
-            violations.append(f"{check_name}: {above_max} values above maximum {max_val}")
+def validate_schema(df: pd.DataFrame, schema: dict, num_cache: dict[str, pd.Series] | None = None,
+                    date_cache: pd.Series | None = None) -> list[ValidationResult]:
+    """Step 1 over a whole DataFrame (see SchemaCheck)."""
+    check = SchemaCheck(schema)
+    check.update(df, num_cache, date_cache)
+    return check.finalize()
 
-    if violations:
-        results.append(ValidationResult(
-            "sanity_checks",
-            "WARN",
-            f"{len(violations)} sanity check violations",
-            {"violations": violations},
-        ))
-    else:
-        results.append(ValidationResult(
-            "sanity_checks",
-            "PASS",
-            "All sanity checks passed",
-        ))
 
-    return results
+def validate_completeness(df: pd.DataFrame, source: str,
+                          date_cache: pd.Series | None = None) -> list[ValidationResult]:
+    """Step 2 over a whole DataFrame (see CompletenessCheck)."""
+    check = CompletenessCheck(source)
+    check.update(df, date_cache=date_cache)
+    return check.finalize()
+
+
+def validate_sanity(df: pd.DataFrame, source: str, rules: dict,
+                    num_cache: dict[str, pd.Series] | None = None) -> list[ValidationResult]:
+    """Step 3 over a whole DataFrame (see SanityCheck)."""
+    check = SanityCheck(source, rules)
+    check.update(df, num_cache)
+    return check.finalize()
 
 
 def validate_cross_source(validated_files: list[Path]) -> list[ValidationResult]:
@@ -519,16 +746,13 @@ def validate_cross_source(validated_files: list[Path]) -> list[ValidationResult]
     results = []
 
     # Group files by date range
-    files_by_range = {}
+    files_by_range = defaultdict(list)
     for f in validated_files:
         # Extract date range from filename
-        name = f.stem
-        parts = name.split("_")
-        # Find date-like parts
-        date_parts = [p for p in parts if len(p) == 10 and p.count("-") == 2]
+        date_parts = FILENAME_DATE_RE.findall(f.stem)
         if len(date_parts) >= 2:
             key = f"{date_parts[0]}_to_{date_parts[-1]}"
-            files_by_range.setdefault(key, []).append(f)
+            files_by_range[key].append(f)
 
     # Check for period mismatches across sources for same geo
     for date_range, files in files_by_range.items():
@@ -564,9 +788,21 @@ def validate_file(filepath: Path, rules: dict) -> FileValidation:
     validation = FileValidation(filepath, source)
     schema = load_schema(source)
 
+    # Only the columns some check reads are parsed
+    needed = set(SANITY_NUMERIC_COLUMNS) | set(CRITICAL_COLUMNS.get(source, [])) | {"Date"}
+    numeric_cols = set(SANITY_NUMERIC_COLUMNS)
+    if schema and isinstance(schema.get("columns"), dict):
+        needed.update(schema["columns"])
+        numeric_cols.update(name for name, spec in schema["columns"].items()
+                            if isinstance(spec, dict) and spec.get("type") in ("integer", "float"))
+
     # Read file
     try:
-        df = pd.read_csv(filepath)
+        header = read_csv_header(filepath)
+        columns = [col for col in header if col in needed]
+        if not columns or len(columns) == len(header) or len(set(header)) != len(header):
+            columns = None
+        chunks = iter_validated_csv(filepath, columns)
     except Exception as e:
         validation.add(ValidationResult(
             "file_read",
@@ -575,7 +811,34 @@ def validate_file(filepath: Path, rules: dict) -> FileValidation:
         ))
         return validation
 
-    if df.empty:
+    # Steps 1-3 accumulate chunk by chunk; a small file is a single chunk
+    checks = (SchemaCheck(schema), CompletenessCheck(source), SanityCheck(source, rules))
+    n_rows = 0
+    n_columns = 0
+    while True:
+        try:
+            df = next(chunks, None)
+        except Exception as e:
+            validation.add(ValidationResult(
+                "file_read",
+                "FAIL",
+                f"Cannot read file: {e}",
+            ))
+            return validation
+        if df is None:
+            break
+        if df.empty:
+            continue
+        n_rows += len(df)
+        n_columns = len(header) if columns else len(df.columns)
+
+        # Coerce each metric column and Date once; all three steps reuse them
+        num_cache = coerce_numeric(df, numeric_cols)
+        date_cache = pd.to_datetime(df["Date"], errors="coerce") if "Date" in df.columns else None
+        for check in checks:
+            check.update(df, num_cache, date_cache)
+
+    if n_rows == 0:
         validation.add(ValidationResult(
             "file_read",
             "FAIL",
@@ -586,25 +849,113 @@ def validate_file(filepath: Path, rules: dict) -> FileValidation:
     validation.add(ValidationResult(
         "file_read",
         "PASS",
-        f"Read {len(df)} rows, {len(df.columns)} columns",
+        f"Read {n_rows} rows, {n_columns} columns",
     ))
 
-    # Step 1: Schema validation
-    for r in validate_schema(df, schema):
-        validation.add(r)
+    for check in checks:
+        for r in check.finalize():
+            validation.add(r)
 
-    # Step 2: Completeness checks
-    for r in validate_completeness(df, source):
-        validation.add(r)
+    return validation
 
-    # Step 3: Sanity checks
-    for r in validate_sanity(df, source, rules):
-        validation.add(r)
 
+def _validation_config_key(rules: dict) -> str:
+    """Everything besides the file itself that validate_file's result depends on."""
+    script = os.stat(__file__)
+    schemas = []
+    try:
+        with os.scandir(SCHEMAS_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".yaml"):
+                    st = entry.stat()
+                    schemas.append((entry.name, st.st_mtime_ns, st.st_size))
+    except FileNotFoundError:
+        pass  # no schemas: validate_file reports "No schema available"
+    schemas.sort()
+    key = {
+        "version": DQ_CACHE_VERSION,
+        "script": (script.st_mtime_ns, script.st_size),
+        "rules": rules,
+        "schemas": schemas,
+    }
+    return json.dumps(key, sort_keys=True, default=str)
+
+
+def _validation_cache_entry(filepath: Path, config_key: str) -> tuple[Path, str]:
+    """Cache file for filepath and the fingerprint its stored result must carry.
+
+    The file name depends only on the path, so a newer result overwrites the
+    older one instead of piling up; the fingerprint covers the file's mtime
+    and size plus config_key.
+    """
+    path_key = hashlib.blake2b(str(filepath.resolve()).encode(), digest_size=16).hexdigest()
+    st = filepath.stat()
+    fingerprint = f"{config_key}|{st.st_mtime_ns}|{st.st_size}"
+    return DQ_CACHE_DIR / f"{path_key}.json", hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+
+
+def _load_cached_validation(filepath: Path, cache_file: Path, fingerprint: str) -> FileValidation | None:
+    """Rebuild a FileValidation from its cache entry, or None when there is no current entry."""
+    try:
+        data = load_json(cache_file.read_bytes())
+        if data["fingerprint"] != fingerprint:
+            return None
+        result = data["result"]
+        validation = FileValidation(filepath, result["source"])
+        for check in result["checks"]:
+            validation.add(ValidationResult(check["check"], check["status"], check["message"], check["details"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # missing, stale-format or corrupt entry: re-validate
     return validation
 
 
-def run_validation(files: list[Path] | None = None, output_json: bool = False) -> dict:
+def validate_files(files: list[Path], rules: dict, jobs: int | None = None,
+                   use_cache: bool = True) -> list[FileValidation]:
+    """Run validate_file over files, in parallel worker processes when there are several.
+
+    Files are independent and the checks are pandas-bound, so processes
+    rather than threads. jobs caps the worker count (default: one per CPU,
+    up to MAX_VALIDATION_WORKERS). Results come back in input order.
+
+    With use_cache, a file whose path, mtime and size, the rules, the
+    schemas and this script are all unchanged since an earlier run gets
+    that run's result from DQ_CACHE_DIR instead of being re-validated.
+    """
+    results: list[FileValidation | None] = [None] * len(files)
+    cache_entries: list[tuple[Path, str] | None] = [None] * len(files)
+    if use_cache:
+        config_key = _validation_config_key(rules)
+        for i, filepath in enumerate(files):
+            try:
+                cache_entries[i] = _validation_cache_entry(filepath, config_key)
+            except OSError:
+                continue  # missing file: validate_file reports it
+            results[i] = _load_cached_validation(filepath, *cache_entries[i])
+
+    pending = [i for i, result in enumerate(results) if result is None]
+    pending_files = [files[i] for i in pending]
+    workers = min(jobs or min(MAX_VALIDATION_WORKERS, os.cpu_count() or 1), len(pending_files))
+    if workers <= 1:
+        fresh = [validate_file(filepath, rules) for filepath in pending_files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(partial(validate_file, rules=rules), pending_files))
+
+    for i, validation in zip(pending, fresh):
+        results[i] = validation
+        if cache_entries[i] is None:
+            continue
+        cache_file, fingerprint = cache_entries[i]
+        try:
+            DQ_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            write_atomic(cache_file, dump_json({"fingerprint": fingerprint, "result": validation.to_dict()}))
+        except OSError:
+            pass  # the cache is an optimisation; never fail validation over it
+    return results
+
+
+def run_validation(files: list[Path] | None = None, output_json: bool = False,
+                   jobs: int | None = None, use_cache: bool = True) -> dict:
     """Run validation on files and return results.
 
     Returns:
@@ -631,10 +982,7 @@ def run_validation(files: list[Path] | None = None, output_json: bool = False) -
             "message": "No files to validate",
         }
 
-    file_results = []
-    for f in files:
-        validation = validate_file(f, rules)
-        file_results.append(validation)
+    file_results = validate_files(files, rules, jobs, use_cache)
 
     # Step 5: Cross-source consistency
     cross_source = validate_cross_source(files)
@@ -650,9 +998,9 @@ def run_validation(files: list[Path] | None = None, output_json: bool = False) -
             overall = "WARN"
 
         # Collect caveats (WARN items)
-        for check in fr.checks:
-            if check.status == "WARN":
-                caveats.append(f"{fr.filepath.name}: {check.message}")
+        for status, message in zip(fr.statuses, fr.messages):
+            if status == "WARN":
+                caveats.append(f"{fr.filepath.name}: {message}")
 
     for cs in cross_source:
         if cs.status == "FAIL":
@@ -679,8 +1027,7 @@ def run_validation(files: list[Path] | None = None, output_json: bool = False) -
 
     # Save results for pipeline use
     PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(PIPELINE_DIR / "dq_results.json", "w") as f:
-        json.dump(result, f, indent=2)
+    (PIPELINE_DIR / "dq_results.json").write_bytes(dump_json(result))
 
     return result
 
@@ -689,6 +1036,10 @@ def main():
     parser = argparse.ArgumentParser(description="Validate preprocessed marketing data files")
     parser.add_argument("files", nargs="*", help="Specific files to validate (default: all in /data/validated/)")
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for per-file checks (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-validate every file instead of reusing results for unchanged files")
     args = parser.parse_args()
 
     if args.files:
@@ -696,10 +1047,10 @@ def main():
     else:
         files = None  # Will default to all validated files
 
-    result = run_validation(files, output_json=args.json)
+    result = run_validation(files, output_json=args.json, jobs=args.jobs, use_cache=not args.no_cache)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        write_json_stdout(result)
     else:
         # Human-readable output
         print(f"\n{'='*60}")
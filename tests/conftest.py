@@ -0,0 +1,36 @@
+"""Shared pytest setup: make the project root and scripts/ importable once per session."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+for path in (PROJECT_ROOT, PROJECT_ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# Subtrees holding the prompts, baselines and schemas the mapping tests reference
+EXISTING_FILE_ROOTS = ("agents", "memory", "data/schemas")
+
+
+def _walk_files(directory: str):
+    """Yield every file path under directory (relative to PROJECT_ROOT, "/"-separated)."""
+    try:
+        entries = list(os.scandir(PROJECT_ROOT / directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        rel = f"{directory}/{entry.name}"
+        if entry.is_dir():
+            yield from _walk_files(rel)
+        else:
+            yield rel
+
+
+@pytest.fixture(scope="session")
+def existing_files() -> frozenset[str]:
+    """Relative paths of all files under EXISTING_FILE_ROOTS, from one directory walk."""
+    return frozenset(rel for root in EXISTING_FILE_ROOTS for rel in _walk_files(root))
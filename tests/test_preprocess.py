@@ -1,14 +1,10 @@
 """Tests for scripts/preprocess.py source detection, column aliasing, and HALO splitting."""
 
-import sys
 import tempfile
 from pathlib import Path
 
 import pandas as pd
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+import pytest
 
 from preprocess import (
     COLUMN_ALIASES,
@@ -16,8 +12,11 @@ from preprocess import (
     SOURCE_SIGNATURES,
     identify_source,
     parse_space_number,
+    parse_space_numbers,
+    read_file,
     split_halo_file,
     standardize_columns,
+    write_csv,
 )
 from run_analysis import CHANNEL_GROUPS
 
@@ -87,6 +86,12 @@ def test_column_alias_maps_spend_to_cost():
     assert "Cost" in result.columns
 
 
+def test_column_alias_orders_depends_on_source():
+    assert "Conversions" in standardize_columns(pd.DataFrame({"Orders": [3]}), "affiliate").columns
+    assert "Transactions" in standardize_columns(pd.DataFrame({"Orders": [3]}), "distribution").columns
+    assert "Orders" in standardize_columns(pd.DataFrame({"orders": [3]}), "promo").columns
+
+
 # ── HALO Channel Map ────────────────────────────────────────────────
 
 
@@ -124,37 +129,86 @@ def test_parse_space_number_nan():
     assert math.isnan(parse_space_number(float("nan")))
 
 
+def test_parse_space_numbers_matches_scalar_parser():
+    col = pd.Series(["1 000", " 12 345 ", "#########", "", None, "n/a", "7"], dtype=object)
+    expected = col.apply(parse_space_number)
+    assert parse_space_numbers(col).equals(expected)
+    assert parse_space_numbers(col.drop(5)).equals(expected.drop(5))
+
+
 # ── HALO File Splitting ─────────────────────────────────────────────
 
 
-def test_split_halo_fixture():
-    """Split the sample HALO fixture and verify output."""
+@pytest.fixture(scope="session")
+def split_halo_result(tmp_path_factory):
+    """Split the sample HALO fixture once into a temporary DATA_VALIDATED."""
+    import preprocess
+
     sample = FIXTURES_DIR / "sample_halo.csv"
     assert sample.exists(), f"Fixture not found: {sample}"
+    # Patch only around the split so later tests see the real DATA_VALIDATED
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(preprocess, "DATA_VALIDATED", tmp_path_factory.mktemp("halo"))
+        result = split_halo_file(sample, dry_run=False)
+    return result
+
+
+def test_split_halo_fixture(split_halo_result):
+    """Split the sample HALO fixture and verify output."""
+    result = split_halo_result
+    assert result["status"] == "success"
+    # sample_halo.csv has 3 channels: affiliate, sem, display (+ Total which is filtered)
+    assert len(result["output_files"]) == 3
 
+    # Verify the files were written
+    written = [Path(f).name for f in result["output_files"]]
+    assert any("affiliate" in f for f in written)
+    assert any("sem" in f for f in written)
+    assert any("display" in f for f in written)
+
+    # Verify each file has 3 rows (3 dates per channel)
+    for f in result["output_files"]:
+        df = pd.read_csv(f)
+        assert len(df) == 3
+        assert "Date" in df.columns
+        assert "Dimension 1" not in df.columns  # Should be dropped
+
+
+# ── File Reading ────────────────────────────────────────────────────
+
+
+def test_read_file_sniffs_separator_and_keeps_dates_as_text():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "export.csv"
+        path.write_text("Campaign;Date;Cost\nBrand;2026-01-01;\nGeneric;2026-01-02;12,50\n")
+        df = read_file(path)
+    assert list(df.columns) == ["Campaign", "Date", "Cost"]
+    assert df["Date"].tolist() == ["2026-01-01", "2026-01-02"]
+    assert pd.isna(df["Cost"][0]) and df["Cost"][1] == "12,50"
+
+
+def test_read_file_falls_back_to_latin1():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "export.csv"
+        path.write_bytes("Campaign,Clicks\nCaf\u00e9,3\n".encode("latin-1"))
+        df = read_file(path)
+    assert df["Campaign"][0] == "Caf\u00e9"
+    assert df["Clicks"][0] == 3
+
+
+def test_write_csv_round_trips_plain_and_quoted_values():
+    df = pd.DataFrame({
+        "Campaign": ["NA_Brand", "Sale, 50% off", None],
+        "Date": ["2026-01-01", "2026-01-02", "2026-01-03"],
+        "Cost": [125.5, 130.0, float("nan")],
+        "Clicks": [250, 260, 0],
+        "Active": [True, False, True],
+    })
     with tempfile.TemporaryDirectory() as tmpdir:
-        # Temporarily override DATA_VALIDATED
-        import preprocess
-        original = preprocess.DATA_VALIDATED
-        preprocess.DATA_VALIDATED = Path(tmpdir)
-        try:
-            result = split_halo_file(sample, dry_run=False)
-        finally:
-            preprocess.DATA_VALIDATED = original
-
-        assert result["status"] == "success"
-        # sample_halo.csv has 3 channels: affiliate, sem, display (+ Total which is filtered)
-        assert len(result["output_files"]) == 3
-
-        # Verify the files were written
-        written = [Path(f).name for f in result["output_files"]]
-        assert any("affiliate" in f for f in written)
-        assert any("sem" in f for f in written)
-        assert any("display" in f for f in written)
-
-        # Verify each file has 3 rows (3 dates per channel)
-        for f in result["output_files"]:
-            df = pd.read_csv(f)
-            assert len(df) == 3
-            assert "Date" in df.columns
-            assert "Dimension 1" not in df.columns  # Should be dropped
+        for frame in (df.drop(index=1), df):
+            path = Path(tmpdir) / "out.csv"
+            write_csv(frame, path)
+            pd.testing.assert_frame_equal(
+                pd.read_csv(path), frame.reset_index(drop=True), check_dtype=False)
+            # Booleans keep pandas' spelling (read_csv would accept either)
+            assert ",True" in path.read_text() and ",true" not in path.read_text()
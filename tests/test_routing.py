@@ -1,11 +1,8 @@
 """Tests for run_analysis.py routing logic and mapping consistency."""
 
-import sys
-from pathlib import Path
+from datetime import date
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+import pytest
 
 from run_analysis import (
     CHANNEL_AGENT_MAP,
@@ -18,7 +15,9 @@ from run_analysis import (
     TEMPLATE_RULES,
     classify_query,
     determine_synthesis_levels,
+    parse_period,
     select_template,
+    validate_channel_output,
 )
 
 
@@ -27,65 +26,55 @@ from run_analysis import (
 
 def test_all_channels_have_agent():
     """Every channel in CHANNEL_GROUPS must have an entry in CHANNEL_AGENT_MAP."""
-    for channel in CHANNEL_GROUPS:
-        assert channel in CHANNEL_AGENT_MAP, f"Channel '{channel}' missing from CHANNEL_AGENT_MAP"
+    missing = set(CHANNEL_GROUPS) - set(CHANNEL_AGENT_MAP)
+    assert not missing, f"Channels missing from CHANNEL_AGENT_MAP: {sorted(missing)}"
 
 
 def test_all_channels_have_baseline():
     """Every channel in CHANNEL_GROUPS must have an entry in CHANNEL_BASELINE_MAP."""
-    for channel in CHANNEL_GROUPS:
-        assert channel in CHANNEL_BASELINE_MAP, f"Channel '{channel}' missing from CHANNEL_BASELINE_MAP"
+    missing = set(CHANNEL_GROUPS) - set(CHANNEL_BASELINE_MAP)
+    assert not missing, f"Channels missing from CHANNEL_BASELINE_MAP: {sorted(missing)}"
 
 
 def test_all_groups_have_synthesis_entry():
     """Every group in GROUP_CHANNELS must have an entry in GROUP_SYNTHESIS_MAP (even if None)."""
-    for group in GROUP_CHANNELS:
-        assert group in GROUP_SYNTHESIS_MAP, f"Group '{group}' missing from GROUP_SYNTHESIS_MAP"
+    missing = set(GROUP_CHANNELS) - set(GROUP_SYNTHESIS_MAP)
+    assert not missing, f"Groups missing from GROUP_SYNTHESIS_MAP: {sorted(missing)}"
 
 
 def test_channel_groups_consistent_with_group_channels():
     """CHANNEL_GROUPS and GROUP_CHANNELS must be consistent inverses."""
-    # Every channel in CHANNEL_GROUPS must appear in its group's list in GROUP_CHANNELS
-    for channel, group in CHANNEL_GROUPS.items():
-        assert group in GROUP_CHANNELS, f"Group '{group}' from CHANNEL_GROUPS not in GROUP_CHANNELS"
-        assert channel in GROUP_CHANNELS[group], (
-            f"Channel '{channel}' mapped to group '{group}' in CHANNEL_GROUPS "
-            f"but not in GROUP_CHANNELS['{group}']"
-        )
-
-    # Every channel listed in GROUP_CHANNELS must have the correct group in CHANNEL_GROUPS
-    for group, channels in GROUP_CHANNELS.items():
-        for ch in channels:
-            assert ch in CHANNEL_GROUPS, f"Channel '{ch}' in GROUP_CHANNELS['{group}'] not in CHANNEL_GROUPS"
-            assert CHANNEL_GROUPS[ch] == group, (
-                f"Channel '{ch}' in GROUP_CHANNELS['{group}'] but CHANNEL_GROUPS['{ch}'] = '{CHANNEL_GROUPS[ch]}'"
-            )
-
-
-def test_agent_prompt_files_exist():
+    forward = set(CHANNEL_GROUPS.items())
+    inverse = {(channel, group) for group, channels in GROUP_CHANNELS.items() for channel in channels}
+    assert forward == inverse, (
+        f"(channel, group) pairs only in CHANNEL_GROUPS: {sorted(forward - inverse)}; "
+        f"only in GROUP_CHANNELS: {sorted(inverse - forward)}"
+    )
+
+
+@pytest.mark.parametrize("channel, agent_path", sorted(CHANNEL_AGENT_MAP.items()))
+def test_agent_prompt_files_exist(existing_files, channel, agent_path):
     """All agent prompt files referenced in CHANNEL_AGENT_MAP must exist."""
-    for channel, agent_path in CHANNEL_AGENT_MAP.items():
-        full_path = PROJECT_ROOT / agent_path
-        assert full_path.exists(), f"Agent prompt file missing for '{channel}': {agent_path}"
+    assert agent_path in existing_files, f"Agent prompt file missing for '{channel}': {agent_path}"
 
 
-def test_group_synthesis_prompt_files_exist():
+@pytest.mark.parametrize(
+    "group, agent_path",
+    sorted((group, path) for group, path in GROUP_SYNTHESIS_MAP.items() if path is not None),
+)
+def test_group_synthesis_prompt_files_exist(existing_files, group, agent_path):
     """All group synthesis prompt files (non-None) must exist."""
-    for group, agent_path in GROUP_SYNTHESIS_MAP.items():
-        if agent_path is not None:
-            full_path = PROJECT_ROOT / agent_path
-            assert full_path.exists(), f"Group synthesis prompt missing for '{group}': {agent_path}"
+    assert agent_path in existing_files, f"Group synthesis prompt missing for '{group}': {agent_path}"
 
 
-def test_baseline_files_exist():
+# One case per distinct baseline file; several channels share a baseline
+@pytest.mark.parametrize(
+    "baseline_path, channel",
+    sorted({path: ch for ch, path in CHANNEL_BASELINE_MAP.items()}.items()),
+)
+def test_baseline_files_exist(existing_files, baseline_path, channel):
     """All baseline files must exist on disk."""
-    seen = set()
-    for channel, baseline_path in CHANNEL_BASELINE_MAP.items():
-        if baseline_path in seen:
-            continue
-        seen.add(baseline_path)
-        full_path = PROJECT_ROOT / baseline_path
-        assert full_path.exists(), f"Baseline file missing for '{channel}': {baseline_path}"
+    assert baseline_path in existing_files, f"Baseline file missing for '{channel}': {baseline_path}"
 
 
 # ── Keyword Routing ──────────────────────────────────────────────────
@@ -93,37 +82,37 @@ def test_baseline_files_exist():
 
 def test_sem_routing():
     result = classify_query("How did SEM perform last week?")
-    assert "sem" in result["channels"]
-    assert "paid" in result["groups"]
+    assert "sem" in result.channels
+    assert "paid" in result.groups
 
 
 def test_display_routing():
     result = classify_query("Show me display campaign performance")
-    assert "display" in result["channels"]
+    assert "display" in result.channels
 
 
 def test_email_routing():
     result = classify_query("How is email performing?")
-    assert "email" in result["channels"]
-    assert "lifecycle" in result["groups"]
+    assert "email" in result.channels
+    assert "lifecycle" in result.groups
 
 
 def test_seo_routing():
     result = classify_query("Organic search rankings and GSC data")
-    assert "seo" in result["channels"]
-    assert "organic" in result["groups"]
+    assert "seo" in result.channels
+    assert "organic" in result.groups
 
 
 def test_crm_group_routing():
     result = classify_query("Show me CRM lifecycle performance")
-    assert "email" in result["channels"]
-    assert "push_notification" in result["channels"]
-    assert "sms" in result["channels"]
+    assert "email" in result.channels
+    assert "push_notification" in result.channels
+    assert "sms" in result.channels
 
 
 def test_paid_group_routing():
     result = classify_query("How are paid channels performing?")
-    channels = result["channels"]
+    channels = result.channels
     assert "sem" in channels
     assert "brand_campaign" in channels
     assert "display" in channels
@@ -133,19 +122,19 @@ def test_paid_group_routing():
 
 def test_promo_routing():
     result = classify_query("What is the promo ROI for our discount campaign?")
-    assert "promo" in result["channels"]
-    assert "pricing" in result["groups"]
+    assert "promo" in result.channels
+    assert "pricing" in result.groups
 
 
 def test_all_channels_routing():
     result = classify_query("Give me an overall view of all channels")
-    assert result["all_channels"] is True
+    assert result.all_channels is True
 
 
 def test_fallback_routing():
     result = classify_query("xyzzy foobar nonsense")
-    assert result["match_type"] == "fallback"
-    assert result["channels"] == []
+    assert result.match_type == "fallback"
+    assert result.channels == ()
 
 
 # ── Template Selection ───────────────────────────────────────────────
@@ -165,6 +154,28 @@ def test_default_template():
     assert select_template("how did sem perform?") == "templates/weekly-report.md"
 
 
+def test_query_fields_single_pass():
+    """Overlapping cues are all detected and keep their precedence."""
+    result = classify_query("sem vs last year, mom too, north america and intl 2024-01-01 to 2024-01-07")
+    assert result.template == "templates/period-comparison.md"
+    assert result.comparison_type == "yoy"
+    assert result.geo == "INTL"
+    assert result.date_range == ("2024-01-01", "2024-01-07")
+
+
+# ── Period Parsing ───────────────────────────────────────────────────
+
+
+def test_parse_period():
+    assert parse_period("2026-02-10/2026-02-16") == (date(2026, 2, 10), date(2026, 2, 16))
+
+
+def test_parse_period_rejects_bad_values():
+    for bad in ["2026-02-10 to 2026-02-16", "2026-02-16/2026-02-10", "2026-13-01/2026-13-02"]:
+        with pytest.raises(ValueError):
+            parse_period(bad)
+
+
 # ── Synthesis Logic ──────────────────────────────────────────────────
 
 
@@ -198,3 +209,20 @@ def test_no_synthesis_for_thin_groups():
     """Pricing group should not trigger group synthesis (None in map)."""
     groups, top = determine_synthesis_levels(["promo"])
     assert "pricing" not in groups  # GROUP_SYNTHESIS_MAP["pricing"] is None
+
+
+# ── Output Validation ────────────────────────────────────────────────
+
+
+def test_delta_pct_mismatch_reported_for_large_summary():
+    """Large summaries take the vectorized path and flag the same rows."""
+    summary = [
+        {"metric": f"m{i}", "current": 110, "prior": 100, "delta_pct": 10.0, "status": "GREEN"}
+        for i in range(100)
+    ]
+    summary[42]["delta_pct"] = 25.0
+    summary[7]["prior"] = 0  # No cross-check possible
+    output = {"channel": "sem", "geo": "ALL", "period": "x", "summary": summary,
+              "top_movers": [{}], "anomalies": [], "data_quality_notes": []}
+    errors = validate_channel_output(output)
+    assert errors == ["summary[42] (m42): delta_pct mismatch. Expected ~10.0%, got 25.0%"]
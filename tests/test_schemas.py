@@ -1,22 +1,43 @@
 """Tests for JSON schema validity and enum consistency."""
 
 import json
-import sys
+from functools import lru_cache
 from pathlib import Path
 
+import pytest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 SCHEMAS_DIR = PROJECT_ROOT / "config" / "schemas"
 
 from run_analysis import CHANNEL_GROUPS, GROUP_CHANNELS
 
 
+@lru_cache(maxsize=None)
 def _load_schema(name: str) -> dict:
+    """Parse a schema once per session; callers only read the result."""
     path = SCHEMAS_DIR / name
     assert path.exists(), f"Schema file not found: {name}"
-    with open(path) as f:
-        return json.load(f)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def enum_index() -> dict[str, dict[str, frozenset]]:
+    """{schema file: {top-level property: frozenset(enum)}} for every property with an enum."""
+    index = {}
+    for path in sorted(SCHEMAS_DIR.glob("*.json")):
+        properties = _load_schema(path.name).get("properties", {})
+        index[path.name] = {
+            prop: frozenset(spec["enum"]) for prop, spec in properties.items() if "enum" in spec
+        }
+    return index
 
 
 # ── Schema Parsing ───────────────────────────────────────────────────
@@ -41,62 +62,42 @@ def test_synthesis_schema_valid_json():
 # ── Enum Consistency ─────────────────────────────────────────────────
 
 
-def test_channel_enum_covers_all_channels():
+@pytest.mark.parametrize("channel", sorted(CHANNEL_GROUPS))
+def test_channel_enum_covers_all_channels(enum_index, channel):
     """channel-output.json channel enum must include all channels from CHANNEL_GROUPS."""
-    schema = _load_schema("channel-output.json")
-    channel_enum = schema["properties"]["channel"]["enum"]
+    assert channel in enum_index["channel-output.json"]["channel"], (
+        f"Channel '{channel}' from CHANNEL_GROUPS missing from channel-output.json enum"
+    )
 
-    for channel in CHANNEL_GROUPS:
-        assert channel in channel_enum, (
-            f"Channel '{channel}' from CHANNEL_GROUPS missing from channel-output.json enum"
-        )
 
-
-def test_channel_group_enum_covers_all_groups():
+@pytest.mark.parametrize("group", sorted(GROUP_CHANNELS))
+def test_channel_group_enum_covers_all_groups(enum_index, group):
     """channel-output.json channel_group enum must include all groups from GROUP_CHANNELS."""
-    schema = _load_schema("channel-output.json")
-    group_enum = schema["properties"]["channel_group"]["enum"]
-
-    for group in GROUP_CHANNELS:
-        assert group in group_enum, (
-            f"Group '{group}' from GROUP_CHANNELS missing from channel-output.json channel_group enum"
-        )
+    assert group in enum_index["channel-output.json"]["channel_group"], (
+        f"Group '{group}' from GROUP_CHANNELS missing from channel-output.json channel_group enum"
+    )
 
 
-def test_group_synthesis_group_enum_covers_all_groups():
+@pytest.mark.parametrize("group", sorted(GROUP_CHANNELS))
+def test_group_synthesis_group_enum_covers_all_groups(enum_index, group):
     """group-synthesis-output.json group enum must include all groups from GROUP_CHANNELS."""
-    schema = _load_schema("group-synthesis-output.json")
-    group_enum = schema["properties"]["group"]["enum"]
-
-    for group in GROUP_CHANNELS:
-        assert group in group_enum, (
-            f"Group '{group}' from GROUP_CHANNELS missing from group-synthesis-output.json enum"
-        )
+    assert group in enum_index["group-synthesis-output.json"]["group"], (
+        f"Group '{group}' from GROUP_CHANNELS missing from group-synthesis-output.json enum"
+    )
 
 
 # ── Nullable Spend Fields ────────────────────────────────────────────
 
 
-def test_group_synthesis_channel_mix_spend_nullable():
+@pytest.mark.parametrize("schema_name", ["group-synthesis-output.json", "synthesis-output.json"])
+@pytest.mark.parametrize("field", ["spend", "spend_share", "roas", "efficiency"])
+def test_channel_mix_spend_nullable(schema_name, field):
     """channel_mix spend/roas/efficiency must accept null for non-spend groups."""
-    schema = _load_schema("group-synthesis-output.json")
-    item_props = schema["properties"]["channel_mix"]["items"]["properties"]
-    for field in ["spend", "spend_share", "roas", "efficiency"]:
-        field_type = item_props[field]["type"]
-        assert isinstance(field_type, list) and "null" in field_type, (
-            f"group-synthesis-output.json channel_mix.{field} must be nullable"
-        )
-
-
-def test_synthesis_channel_mix_spend_nullable():
-    """synthesis-output.json channel_mix spend/roas/efficiency must accept null."""
-    schema = _load_schema("synthesis-output.json")
-    item_props = schema["properties"]["channel_mix"]["items"]["properties"]
-    for field in ["spend", "spend_share", "roas", "efficiency"]:
-        field_type = item_props[field]["type"]
-        assert isinstance(field_type, list) and "null" in field_type, (
-            f"synthesis-output.json channel_mix.{field} must be nullable"
-        )
+    item_props = _load_schema(schema_name)["properties"]["channel_mix"]["items"]["properties"]
+    field_type = item_props[field]["type"]
+    assert isinstance(field_type, list) and "null" in field_type, (
+        f"{schema_name} channel_mix.{field} must be nullable"
+    )
 
 
 def test_group_synthesis_channel_mix_has_volume_fields():
@@ -1,8 +1,8 @@
 """Tests for scripts/validate_data.py mapping consistency."""
 
-import sys
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 try:
@@ -11,11 +11,9 @@ except ImportError:
     yaml_mod = None
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
 
 from preprocess import SOURCE_SIGNATURES
-from validate_data import SOURCE_RULES_MAP, SOURCE_SCHEMA_MAP
+from validate_data import SOURCE_RULES_MAP, SOURCE_SCHEMA_MAP, read_validated_csv
 
 SCHEMAS_DIR = PROJECT_ROOT / "data" / "schemas"
 CONFIG_DIR = PROJECT_ROOT / "config"
@@ -34,18 +32,18 @@ def test_every_preprocess_source_has_schema_entry():
         )
 
 
-def test_every_schema_entry_has_yaml_file():
+# One case per distinct schema; several sources share one
+@pytest.mark.parametrize(
+    "schema_key, source",
+    sorted({key: src for src, key in SOURCE_SCHEMA_MAP.items()}.items()),
+)
+def test_every_schema_entry_has_yaml_file(existing_files, schema_key, source):
     """Every schema value in SOURCE_SCHEMA_MAP should point to an existing .yaml file."""
-    seen = set()
-    for source, schema_key in SOURCE_SCHEMA_MAP.items():
-        if schema_key in seen:
-            continue
-        seen.add(schema_key)
-        schema_path = SCHEMAS_DIR / f"{schema_key}.yaml"
-        assert schema_path.exists(), (
-            f"Schema file '{schema_key}.yaml' referenced by SOURCE_SCHEMA_MAP['{source}'] "
-            f"does not exist at {schema_path}"
-        )
+    schema_path = SCHEMAS_DIR / f"{schema_key}.yaml"
+    assert f"data/schemas/{schema_key}.yaml" in existing_files, (
+        f"Schema file '{schema_key}.yaml' referenced by SOURCE_SCHEMA_MAP['{source}'] "
+        f"does not exist at {schema_path}"
+    )
 
 
 # ── Rules Map Coverage ───────────────────────────────────────────────
@@ -61,21 +59,150 @@ def test_every_preprocess_source_has_rules_entry():
         )
 
 
-@pytest.mark.skipif(yaml_mod is None, reason="pyyaml not installed")
-def test_every_rules_entry_has_config_key():
-    """Every rules key in SOURCE_RULES_MAP should exist in data-quality-rules.yaml."""
+@pytest.fixture(scope="session")
+def data_quality_rules() -> dict:
+    """data-quality-rules.yaml parsed once per session, with libyaml when available."""
     rules_path = CONFIG_DIR / "data-quality-rules.yaml"
     assert rules_path.exists(), "data-quality-rules.yaml not found"
+    loader = getattr(yaml_mod, "CSafeLoader", yaml_mod.SafeLoader)
+    return yaml_mod.load(rules_path.read_text(), Loader=loader) or {}
 
-    with open(rules_path) as f:
-        rules = yaml_mod.safe_load(f) or {}
-
-    seen = set()
-    for source, rules_key in SOURCE_RULES_MAP.items():
-        if rules_key in seen:
-            continue
-        seen.add(rules_key)
-        assert rules_key in rules, (
-            f"Rules key '{rules_key}' referenced by SOURCE_RULES_MAP['{source}'] "
-            f"does not exist in data-quality-rules.yaml"
-        )
+
+@pytest.mark.skipif(yaml_mod is None, reason="pyyaml not installed")
+def test_every_rules_entry_has_config_key(data_quality_rules):
+    """Every rules key in SOURCE_RULES_MAP should exist in data-quality-rules.yaml."""
+    missing = {
+        source: rules_key for source, rules_key in SOURCE_RULES_MAP.items()
+        if rules_key not in data_quality_rules
+    }
+    assert not missing, (
+        f"Rules keys referenced by SOURCE_RULES_MAP do not exist in data-quality-rules.yaml: {missing}"
+    )
+
+
+# ── CSV Reader ───────────────────────────────────────────────────────
+
+
+def test_read_validated_csv_matches_pandas_nulls(tmp_path):
+    """The PyArrow reader should null the same cells and parse the same numbers as pd.read_csv."""
+    path = tmp_path / "google-ads_all_2026-01-01_to_2026-01-03.csv"
+    path.write_text(
+        "Date,Campaign,Cost,Clicks\n"
+        "2026-01-01,Brand,1.5,None\n"
+        "2026-01-02,,n/a,4\n"
+        "2026-01-03,Generic,2,<NA>\n"
+    )
+    df = read_validated_csv(path)
+    expected = pd.read_csv(path)
+    pd.testing.assert_frame_equal(df.drop(columns="Date"), expected.drop(columns="Date"), check_dtype=False)
+    assert list(pd.to_datetime(df["Date"])) == list(pd.to_datetime(expected["Date"]))
+
+
+def test_read_validated_csv_parses_requested_columns(tmp_path):
+    """With PyArrow available, only the requested columns should be parsed."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "google-ads_all_2026-01-01_to_2026-01-02.csv"
+    path.write_text("Date,Campaign,Cost,Notes\n2026-01-01,Brand,1.5,x\n2026-01-02,Generic,2,y\n")
+    df = read_validated_csv(path, ["Date", "Cost"])
+    assert list(df.columns) == ["Date", "Cost"]
+    assert df["Cost"].tolist() == [1.5, 2.0]
+
+
+# ── Chunked Validation ───────────────────────────────────────────────
+
+
+@pytest.mark.skipif(yaml_mod is None, reason="pyyaml not installed")
+def test_chunked_validation_matches_whole_file(tmp_path, monkeypatch):
+    """Streaming a file in small chunks should give the same checks as reading it whole."""
+    import validate_data
+
+    path = tmp_path / "google-ads_all_2026-01-01_to_2026-01-10.csv"
+    rows = ["Date,Campaign,Impressions,Clicks,Cost,Conversions,Conversion Value"]
+    for day in (1, 2, 3, 5, 6, 9, 10):
+        rows.append(f"2026-01-{day:02d},Brand,100,{day * 20},{day * 3.5},2,{day * 10}")
+        rows.append(f"2026-01-{day:02d},,0,0,n/a,0,0")
+    path.write_text("\n".join(rows) + "\n")
+    monkeypatch.setattr(validate_data, "YAML_CACHE_DIR", tmp_path / "cache")
+    rules = validate_data.load_config("data-quality-rules.yaml")
+
+    whole = validate_data.validate_file(path, rules).to_dict()
+    monkeypatch.setattr(validate_data, "VALIDATION_STREAM_BYTES", 0)
+    monkeypatch.setattr(validate_data, "VALIDATION_CHUNK_ROWS", 3)
+    chunked = validate_data.validate_file(path, rules).to_dict()
+
+    assert chunked == whole
+    assert whole["checks"][0]["message"] == "Read 14 rows, 7 columns"
+
+
+@pytest.mark.skipif(yaml_mod is None, reason="pyyaml not installed")
+def test_yaml_cache_reused_until_file_changes(tmp_path, monkeypatch):
+    """A cached parse should be served while the YAML is unchanged and dropped once it changes."""
+    import os
+
+    import validate_data
+
+    monkeypatch.setattr(validate_data, "YAML_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "rules.yaml"
+    path.write_text("a: 1\n")
+    assert validate_data._load_yaml(path) == {"a": 1}
+    assert list((tmp_path / "cache").glob("*.pkl"))
+
+    # Same size and mtime: the cached parse is served
+    st = path.stat()
+    path.write_text("a: 2\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert validate_data._load_yaml(path) == {"a": 1}
+
+    path.write_text("a: 22\n")
+    assert validate_data._load_yaml(path) == {"a": 22}
+
+
+@pytest.mark.skipif(yaml_mod is None, reason="pyyaml not installed")
+def test_validate_files_reuses_cached_results(tmp_path, monkeypatch):
+    """Unchanged files should be served from the result cache; touched files re-validated,
+    with the new result replacing the old entry."""
+    import os
+
+    import validate_data
+
+    path = tmp_path / "google-ads_all_2026-01-01_to_2026-01-03.csv"
+    rows = ["Date,Campaign,Impressions,Clicks,Cost,Conversions,Conversion Value"]
+    rows += [f"2026-01-0{day},Brand,100,20,3.5,2,10" for day in (1, 2, 3)]
+    path.write_text("\n".join(rows) + "\n")
+    monkeypatch.setattr(validate_data, "YAML_CACHE_DIR", tmp_path / "yaml_cache")
+    monkeypatch.setattr(validate_data, "DQ_CACHE_DIR", tmp_path / "dq_cache")
+    rules = validate_data.load_config("data-quality-rules.yaml")
+
+    validate_file = validate_data.validate_file
+    first = validate_data.validate_files([path], rules)[0].to_dict()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validate_file called for an unchanged file")
+
+    monkeypatch.setattr(validate_data, "validate_file", fail)
+    assert validate_data.validate_files([path], rules)[0].to_dict() == first
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    with pytest.raises(AssertionError):
+        validate_data.validate_files([path], rules)
+
+    monkeypatch.setattr(validate_data, "validate_file", validate_file)
+    assert validate_data.validate_files([path], rules)[0].to_dict() == first
+    assert len(list((tmp_path / "dq_cache").iterdir())) == 1
+
+
+def test_validate_files_without_schemas_dir(tmp_path, monkeypatch):
+    """A missing schemas directory should be reported per file, not crash the cache key."""
+    import validate_data
+
+    path = tmp_path / "google-ads_all_2026-01-01_to_2026-01-01.csv"
+    path.write_text("Date,Campaign\n2026-01-01,Brand\n")
+    monkeypatch.setattr(validate_data, "SCHEMAS_DIR", tmp_path / "missing")
+    monkeypatch.setattr(validate_data, "DQ_CACHE_DIR", tmp_path / "dq_cache")
+    validate_data.load_schema.cache_clear()
+    try:
+        result = validate_data.validate_files([path], {})[0].to_dict()
+    finally:
+        validate_data.load_schema.cache_clear()
+    assert any("No schema available" in check["message"] for check in result["checks"])